@@ -6,12 +6,51 @@ for persistent storage of application and plugin settings.
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
 from pathlib import Path
 import json
 
 from PyQt6.QtCore import QSettings
 
+# Default configuration values
+_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        # Application settings
+        "app/theme": "default",
+        "app/language": "en",
+        "app/auto_save": True,
+        "app/auto_save_interval": 300,  # seconds
+        "app/recent_files_count": 10,
+        # Window settings
+        "window/geometry": None,
+        "window/state": None,
+        "window/maximized": False,
+        # Units settings
+        "units/length": "mm",
+        "units/force": "N",
+        "units/stress": "MPa",
+        "units/moment": "N.mm",
+        "units/temperature": "C",
+        # IFC settings
+        "ifc/default_schema": "IFC4",
+        "ifc/precision": 6,
+        "ifc/units_context": "metric",
+        # Calculation settings
+        "calc/precision": 3,
+        "calc/safety_factors": {"concrete": 1.5, "steel": 1.15, "timber": 1.3},
+        # Plugin settings
+        "plugins/auto_load": True,
+        "plugins/disabled": [],
+        # Logging settings
+        "logging/level": "INFO",
+        "logging/file_enabled": True,
+        "logging/console_enabled": True,
+        "logging/max_file_size": 10485760,  # 10MB
+        "logging/backup_count": 5,
+    }
+)
+
 
 class ConfigManager:
     """
@@ -38,41 +77,8 @@ class ConfigManager:
         # Initialize QSettings
         self.settings = QSettings(organization, application)
 
-        # Default configuration values
-        self.defaults = {
-            # Application settings
-            "app/theme": "default",
-            "app/language": "en",
-            "app/auto_save": True,
-            "app/auto_save_interval": 300,  # seconds
-            "app/recent_files_count": 10,
-            # Window settings
-            "window/geometry": None,
-            "window/state": None,
-            "window/maximized": False,
-            # Units settings
-            "units/length": "mm",
-            "units/force": "N",
-            "units/stress": "MPa",
-            "units/moment": "N.mm",
-            "units/temperature": "C",
-            # IFC settings
-            "ifc/default_schema": "IFC4",
-            "ifc/precision": 6,
-            "ifc/units_context": "metric",
-            # Calculation settings
-            "calc/precision": 3,
-            "calc/safety_factors": {"concrete": 1.5, "steel": 1.15, "timber": 1.3},
-            # Plugin settings
-            "plugins/auto_load": True,
-            "plugins/disabled": [],
-            # Logging settings
-            "logging/level": "INFO",
-            "logging/file_enabled": True,
-            "logging/console_enabled": True,
-            "logging/max_file_size": 10485760,  # 10MB
-            "logging/backup_count": 5,
-        }
+        # Default configuration values (shared, read-only)
+        self.defaults = _DEFAULTS
 
         self.logger.info("Configuration manager initialized")
 
@@ -207,9 +213,9 @@ class ConfigManager:
         try:
             if prefix:
                 # Reset only settings with the given prefix
-                for key in list(self.defaults.keys()):
+                for key, value in self.defaults.items():
                     if key.startswith(prefix):
-                        self.set_setting(key, self.defaults[key])
+                        self.set_setting(key, value)
             else:
                 # Reset all settings
                 self.settings.clear()
@@ -329,14 +335,21 @@ class ConfigManager:
         Args:
             file_path: Path to the file
         """
-        recent_files = self.get_recent_files()
+        self.add_recent_files([file_path])
+
+    def add_recent_files(self, file_paths: Iterable[str]) -> None:
+        """
+        Add several files to the recent files list with a single write.
 
-        # Remove if already in list
-        if file_path in recent_files:
-            recent_files.remove(file_path)
+        Files are added in order, so the last path becomes the most recent.
 
-        # Add to beginning
-        recent_files.insert(0, file_path)
+        Args:
+            file_paths: Paths to the files
+        """
+        # Newest first, dropping earlier occurrences of re-added files
+        recent_files = list(
+            dict.fromkeys([*reversed(list(file_paths)), *self.get_recent_files()])
+        )
 
         # Limit list size
         max_count = self.get_setting("app/recent_files_count", 10)
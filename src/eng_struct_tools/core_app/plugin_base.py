@@ -5,6 +5,7 @@ This module defines the abstract base classes and interfaces that all plugins
 must implement to integrate with the core application.
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Any, Dict
 from dataclasses import dataclass
@@ -243,7 +244,7 @@ class PluginBase(ABC):
         
         for dep in info.dependencies:
             try:
-                __import__(dep)
+                importlib.import_module(dep)
             except ImportError:
                 missing.append(dep)
         
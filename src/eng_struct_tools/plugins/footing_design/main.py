@@ -6,7 +6,8 @@ design functionality according to the plugin architecture.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -23,7 +24,9 @@ from ...shared_libs.common_ui_widgets import (
     ResultsTable,
     ProgressDialog,
 )
-from ...shared_libs.unit_converter import unit_converter
+
+# Result value types displayed with fixed precision
+_NUM = (int, float)
 
 
 class FootingDesignWidget(QWidget):
@@ -34,6 +37,18 @@ class FootingDesignWidget(QWidget):
     running calculations, and displaying results.
     """
 
+    # Default input values restored by the Clear button
+    _LOAD_DEFAULTS = {
+        "axial_load": 1000000.0,
+        "moment_x": 0.0,
+        "moment_y": 0.0,
+        "shear_x": 0.0,
+        "shear_y": 0.0,
+    }
+    _GEO_DEFAULTS = {"length": 2000.0, "width": 2000.0, "thickness": 500.0}
+    _MAT_DEFAULTS = {"concrete_strength": 25.0, "steel_strength": 500.0, "cover": 50.0}
+    _SOIL_DEFAULTS = {"bearing_capacity": 0.2, "unit_weight": 18.0}
+
     def __init__(self, plugin_instance, parent: Optional[QWidget] = None):
         """
         Initialize the footing design widget.
@@ -270,39 +285,31 @@ class FootingDesignWidget(QWidget):
 
         return data
 
-    def _display_results(self, results: Dict[str, Any]) -> None:
-        """Display calculation results."""
+    def _display_results(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Display calculation results.
+
+        Args:
+            results: Results from run_design, grouped as {category: {name: value}}
+        """
+        # Resolve the unit for each distinct parameter name once
+        units = {
+            key: self._get_unit_for_parameter(key)
+            for values in results.values()
+            for key in values
+        }
+
         # Convert results to table format
-        table_data = []
-
-        for category, values in results.items():
-            if isinstance(values, dict):
-                for key, value in values.items():
-                    table_data.append(
-                        {
-                            "Category": category,
-                            "Parameter": key,
-                            "Value": (
-                                f"{value:.3f}"
-                                if isinstance(value, (int, float))
-                                else str(value)
-                            ),
-                            "Unit": self._get_unit_for_parameter(key),
-                        }
-                    )
-            else:
-                table_data.append(
-                    {
-                        "Category": "General",
-                        "Parameter": category,
-                        "Value": (
-                            f"{values:.3f}"
-                            if isinstance(values, (int, float))
-                            else str(values)
-                        ),
-                        "Unit": self._get_unit_for_parameter(category),
-                    }
-                )
+        table_data = [
+            {
+                "Category": category,
+                "Parameter": key,
+                "Value": format(value, ".3f") if type(value) in _NUM else str(value),
+                "Unit": units[key],
+            }
+            for category, values in results.items()
+            for key, value in values.items()
+        ]
 
         self.results_table.set_data(table_data)
 
@@ -327,25 +334,10 @@ class FootingDesignWidget(QWidget):
     def _clear_inputs(self) -> None:
         """Clear all input fields."""
         # Reset to default values
-        self.loads_group.set_values(
-            {
-                "axial_load": 1000000.0,
-                "moment_x": 0.0,
-                "moment_y": 0.0,
-                "shear_x": 0.0,
-                "shear_y": 0.0,
-            }
-        )
-
-        self.geometry_group.set_values(
-            {"length": 2000.0, "width": 2000.0, "thickness": 500.0}
-        )
-
-        self.material_group.set_values(
-            {"concrete_strength": 25.0, "steel_strength": 500.0, "cover": 50.0}
-        )
-
-        self.soil_group.set_values({"bearing_capacity": 0.2, "unit_weight": 18.0})
+        self.loads_group.set_values(self._LOAD_DEFAULTS)
+        self.geometry_group.set_values(self._GEO_DEFAULTS)
+        self.material_group.set_values(self._MAT_DEFAULTS)
+        self.soil_group.set_values(self._SOIL_DEFAULTS)
 
         self.results_table.clear_data()
         self.log_text.clear()
@@ -359,8 +351,6 @@ class FootingDesignWidget(QWidget):
 
     def _log_message(self, message: str) -> None:
         """Add a message to the calculation log."""
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_text.append(f"[{timestamp}] {message}")
 
@@ -378,6 +368,9 @@ class FootingDesignPlugin(DesignPlugin):
         super().__init__()
         self.logger = logging.getLogger(__name__)
 
+        # Validation results keyed by a snapshot of the input data
+        self._validation_cache: Dict[frozenset, Tuple[bool, List[str]]] = {}
+
     def get_plugin_info(self) -> PluginInfo:
         """Get plugin information."""
         return PluginInfo(
@@ -430,7 +423,7 @@ class FootingDesignPlugin(DesignPlugin):
             input_data: Input parameters for the design
 
         Returns:
-            Design results dictionary
+            Design results grouped by category, as {category: {name: value}}
         """
         try:
             # TODO: Implement actual footing design calculations
@@ -478,6 +471,17 @@ class FootingDesignPlugin(DesignPlugin):
         Returns:
             Tuple of (is_valid, error_messages)
         """
+        try:
+            cache_key: Optional[frozenset] = frozenset(input_data.items())
+        except TypeError:
+            # Inputs with unhashable values are validated without caching
+            cache_key = None
+
+        if cache_key is not None:
+            cached = self._validation_cache.get(cache_key)
+            if cached is not None:
+                return cached[0], list(cached[1])
+
         errors = []
 
         # Check required parameters
@@ -516,6 +520,12 @@ class FootingDesignPlugin(DesignPlugin):
             if applied_pressure > allowable_pressure:
                 errors.append("Applied bearing pressure exceeds allowable capacity")
 
+        if cache_key is not None:
+            # Keep the cache small; inputs rarely cycle through many combinations
+            if len(self._validation_cache) > 32:
+                self._validation_cache.clear()
+            self._validation_cache[cache_key] = (len(errors) == 0, list(errors))
+
         return len(errors) == 0, errors
 
     def check_design_codes(self) -> List[str]:
@@ -30,8 +30,8 @@ from PyQt6.QtWidgets import (
     QRadioButton,
     QButtonGroup,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QLocale
+from PyQt6.QtGui import QFont, QPalette, QColor, QDoubleValidator
 
 
 class StatusWidget(QWidget):
@@ -97,7 +97,8 @@ class LabeledInput(QWidget):
 
         Args:
             label: Label text
-            input_type: Type of input ('text', 'double', 'int', 'combo')
+            input_type: Type of input ('text', 'double', 'double_large', 'int',
+                'combo')
             parent: Parent widget
         """
         super().__init__(parent)
@@ -117,38 +118,54 @@ class LabeledInput(QWidget):
         # Input widget based on type
         if self.input_type == "text":
             self.input_widget = QLineEdit()
-            self.input_widget.textChanged.connect(
-                lambda: self.valueChanged.emit(self.get_value())
-            )
+            self.input_widget.textChanged.connect(self.valueChanged.emit)
         elif self.input_type == "double":
             self.input_widget = QDoubleSpinBox()
             self.input_widget.setRange(-999999.0, 999999.0)
             self.input_widget.setDecimals(3)
-            self.input_widget.valueChanged.connect(
-                lambda: self.valueChanged.emit(self.get_value())
+            self.input_widget.valueChanged.connect(self.valueChanged.emit)
+        elif self.input_type == "double_large":
+            # Validated line edit; avoids spin box stepping/formatting over
+            # very wide numeric ranges
+            self.input_widget = QLineEdit()
+            locale = QLocale.c()
+            locale.setNumberOptions(
+                QLocale.NumberOption.OmitGroupSeparator
+                | QLocale.NumberOption.RejectGroupSeparator
             )
+            self._validator = QDoubleValidator(-1e12, 1e12, 3, self.input_widget)
+            self._validator.setLocale(locale)
+            self.input_widget.setValidator(self._validator)
+            self.input_widget.textChanged.connect(self._emit_large_value)
         elif self.input_type == "int":
             self.input_widget = QSpinBox()
             self.input_widget.setRange(-999999, 999999)
-            self.input_widget.valueChanged.connect(
-                lambda: self.valueChanged.emit(self.get_value())
-            )
+            self.input_widget.valueChanged.connect(self.valueChanged.emit)
         elif self.input_type == "combo":
             self.input_widget = QComboBox()
-            self.input_widget.currentTextChanged.connect(
-                lambda: self.valueChanged.emit(self.get_value())
-            )
+            self.input_widget.currentTextChanged.connect(self.valueChanged.emit)
         else:
             self.input_widget = QLineEdit()
 
         layout.addWidget(self.input_widget)
 
+    def _emit_large_value(self, text: str) -> None:
+        """Emit the parsed value of a 'double_large' input."""
+        self.valueChanged.emit(self.get_value())
+
     def get_value(self) -> Any:
         """Get the current value."""
         if self.input_type == "text":
             return self.input_widget.text()
         elif self.input_type in ["double", "int"]:
             return self.input_widget.value()
+        elif self.input_type == "double_large":
+            value, ok = self._validator.locale().toDouble(self.input_widget.text())
+            if not ok:
+                # Empty or intermediate input such as "-" or "1e"
+                return 0.0
+            # Clamp out-of-range input the way a spin box would
+            return min(max(value, self._validator.bottom()), self._validator.top())
         elif self.input_type == "combo":
             return self.input_widget.currentText()
         return None
@@ -159,6 +176,12 @@ class LabeledInput(QWidget):
             self.input_widget.setText(str(value))
         elif self.input_type in ["double", "int"]:
             self.input_widget.setValue(value)
+        elif self.input_type == "double_large":
+            value = min(max(value, self._validator.bottom()), self._validator.top())
+            text = f"{value:.{self._validator.decimals()}f}"
+            if "." in text:
+                text = text.rstrip("0").rstrip(".")
+            self.input_widget.setText(text)
         elif self.input_type == "combo":
             self.input_widget.setCurrentText(str(value))
 
@@ -172,6 +195,9 @@ class LabeledInput(QWidget):
         """Set range for numeric inputs."""
         if self.input_type in ["double", "int"]:
             self.input_widget.setRange(minimum, maximum)
+        elif self.input_type == "double_large":
+            self._validator.setBottom(minimum)
+            self._validator.setTop(maximum)
 
 
 class ParameterGroup(QGroupBox):
@@ -179,6 +205,9 @@ class ParameterGroup(QGroupBox):
     Group box for organizing related parameters.
     """
 
+    # Numeric ranges wider than this use a validated line edit, not a spin box
+    LARGE_RANGE_THRESHOLD = 1e8
+
     def __init__(self, title: str, parent: Optional[QWidget] = None):
         """
         Initialize the parameter group.
@@ -219,12 +248,19 @@ class ParameterGroup(QGroupBox):
         Returns:
             The created LabeledInput widget
         """
+        if (
+            input_type == "double"
+            and range_values
+            and range_values[1] - range_values[0] > self.LARGE_RANGE_THRESHOLD
+        ):
+            input_type = "double_large"
+
         param_widget = LabeledInput(label, input_type)
 
         if items and input_type == "combo":
             param_widget.set_items(items)
 
-        if range_values and input_type in ["double", "int"]:
+        if range_values and input_type in ["double", "double_large", "int"]:
             param_widget.set_range(range_values[0], range_values[1])
 
         if default_value is not None:
@@ -241,9 +277,8 @@ class ParameterGroup(QGroupBox):
 
     def set_values(self, values: Dict[str, Any]) -> None:
         """Set parameter values."""
-        for name, value in values.items():
-            if name in self.parameters:
-                self.parameters[name].set_value(value)
+        for name in self.parameters.keys() & values.keys():
+            self.parameters[name].set_value(values[name])
 
     def get_parameter(self, name: str) -> Optional[LabeledInput]:
         """Get a specific parameter widget."""
@@ -258,6 +293,7 @@ class ResultsTable(QTableWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the results table."""
         super().__init__(parent)
+        self._current_headers: List[str] = []
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -304,24 +340,33 @@ class ResultsTable(QTableWidget):
         if not data:
             self.setRowCount(0)
             self.setColumnCount(0)
+            self._current_headers = []
             return
 
         # Determine headers
         if headers is None:
             headers = list(data[0].keys())
 
-        # Set table dimensions
-        self.setRowCount(len(data))
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        # Only resize when the shape changes; existing items are reused
+        if headers != self._current_headers:
+            self.setColumnCount(len(headers))
+            self.setHorizontalHeaderLabels(headers)
+            self._current_headers = list(headers)
+
+        if self.rowCount() != len(data):
+            self.setRowCount(len(data))
 
         # Populate data
         for row, row_data in enumerate(data):
             for col, header in enumerate(headers):
-                value = row_data.get(header, "")
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.setItem(row, col, item)
+                text = str(row_data.get(header, ""))
+                item = self.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem(text)
+                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                    self.setItem(row, col, item)
+                else:
+                    item.setText(text)
 
     def add_row(self, row_data: Dict[str, Any]) -> None:
         """Add a single row to the table."""
@@ -5,22 +5,54 @@ This module provides a simplified interface for working with IFC files,
 including reading, writing, and manipulating IFC data for structural engineering.
 """
 
+import importlib.util
 import logging
-from typing import Dict, List, Optional, Any, Union, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
 import uuid
 from datetime import datetime
 
-try:
+if TYPE_CHECKING:
     import ifcopenshell
-    import ifcopenshell.api
-    import ifcopenshell.util.element
-    import ifcopenshell.util.unit
 
-    IFC_AVAILABLE = True
-except ImportError:
-    IFC_AVAILABLE = False
-    ifcopenshell = None
+# ifcopenshell loads its C extension and schemas on import, so it is only
+# imported once an IFCManager is actually created
+IFC_AVAILABLE = importlib.util.find_spec("ifcopenshell") is not None
+
+
+def _import_ifcopenshell() -> None:
+    """
+    Import ifcopenshell and the submodules used by this module.
+
+    The imports bind the module-level ``ifcopenshell`` name; repeated calls
+    are resolved from the import cache.
+    """
+    global IFC_AVAILABLE, ifcopenshell
+
+    try:
+        import ifcopenshell
+        import ifcopenshell.api
+        import ifcopenshell.guid
+        import ifcopenshell.util.element
+        import ifcopenshell.util.unit
+    except ImportError as e:
+        IFC_AVAILABLE = False
+        raise IFCError(f"ifcopenshell is installed but could not be imported: {e}")
+
+
+# Structural element types mapped to their IFC entity classes
+_TYPE_MAPPING = {
+    "beam": "IfcBeam",
+    "column": "IfcColumn",
+    "footing": "IfcFooting",
+    "slab": "IfcSlab",
+    "wall": "IfcWall",
+    "member": "IfcMember",
+}
+
+# Keys added by get_psets that are not element properties
+_RESERVED_PSET_KEYS = frozenset(("id", "type"))
 
 
 class IFCError(Exception):
@@ -37,6 +69,12 @@ class IFCManager:
     to common IFC operations for structural engineering applications.
     """
 
+    # Maximum number of elements whose property sets are kept cached
+    PSET_CACHE_SIZE = 1024
+
+    # Maximum number of GUID to step id mappings kept cached
+    GUID_CACHE_SIZE = 4096
+
     def __init__(self):
         """Initialize the IFC manager."""
         self.logger = logging.getLogger(__name__)
@@ -45,12 +83,29 @@ class IFCManager:
             self.logger.error("ifcopenshell is not available")
             raise IFCError("ifcopenshell library is required but not installed")
 
+        _import_ifcopenshell()
+
         self.model: Optional[ifcopenshell.file] = None
         self.file_path: Optional[Path] = None
 
+        # True when the current model was opened read-only in streaming mode
+        self._streaming = False
+
+        # by_type results for the current model, keyed by IFC type name
+        self._type_cache: Dict[str, List[Any]] = {}
+
+        # Project units of the current model, keyed by IFC unit type
+        self._unit_cache: Dict[str, Any] = {}
+
+        # get_psets results keyed by element id, least recently used first
+        self._pset_cache: "OrderedDict[int, Dict[str, Dict[str, Any]]]" = OrderedDict()
+
+        # Step ids of elements resolved by GUID, least recently used first
+        self._guid_cache: "OrderedDict[str, int]" = OrderedDict()
+
         self.logger.info("IFC manager initialized")
 
-    def create_new_model(self, schema: str = "IFC4") -> ifcopenshell.file:
+    def create_new_model(self, schema: str = "IFC4") -> "ifcopenshell.file":
         """
         Create a new IFC model.
 
@@ -63,9 +118,11 @@ class IFCManager:
         try:
             self.model = ifcopenshell.file(schema=schema)
             self.file_path = None
+            self._streaming = False
 
             # Create basic project structure
             self._create_basic_structure()
+            self.flush_caches()
 
             self.logger.info(f"Created new IFC model with schema {schema}")
             return self.model
@@ -74,26 +131,47 @@ class IFCManager:
             self.logger.error(f"Failed to create new IFC model: {e}")
             raise IFCError(f"Cannot create new IFC model: {e}")
 
-    def load_model(self, file_path: Union[str, Path]) -> ifcopenshell.file:
+    def load_model(
+        self, file_path: Union[str, Path], *, mode: str = "full"
+    ) -> "ifcopenshell.file":
         """
         Load an IFC model from file.
 
+        Streamed models only support queries by type and step id: GUID
+        lookups, property and unit queries, validation, creating elements and
+        editing properties raise IFCError.
+
         Args:
             file_path: Path to IFC file
+            mode: "full" parses the whole file into memory, "stream" opens it
+                read-only without a full parse
 
         Returns:
             Loaded IFC model
         """
+        if mode not in ("full", "stream"):
+            raise IFCError(f"Unknown load mode: {mode}")
+
         try:
             file_path = Path(file_path)
 
             if not file_path.exists():
                 raise IFCError(f"IFC file not found: {file_path}")
 
-            self.model = ifcopenshell.open(str(file_path))
+            streaming = mode == "stream"
+
+            if streaming:
+                self.model = ifcopenshell.open(str(file_path), should_stream=True)
+            else:
+                self.model = ifcopenshell.open(str(file_path))
             self.file_path = file_path
+            self._streaming = streaming
+            self.flush_caches()
 
-            self.logger.info(f"Loaded IFC model from {file_path}")
+            self.logger.info(
+                f"Loaded IFC model from {file_path}"
+                + (" (streaming)" if streaming else "")
+            )
             return self.model
 
         except Exception as e:
@@ -129,64 +207,50 @@ class IFCManager:
 
     def _create_basic_structure(self) -> None:
         """Create basic IFC project structure."""
-        if self.model is None:
+        model = self.model
+        if model is None:
             return
 
         try:
-            # Create project
-            project = ifcopenshell.api.run(
-                "root.create_entity",
-                self.model,
-                ifc_class="IfcProject",
-                name="Structural Engineering Project",
-            )
+            new_guid = ifcopenshell.guid.new
 
-            # Create units
-            ifcopenshell.api.run(
-                "unit.assign_unit",
-                self.model,
-                length={"is_metric": True, "raw": "MILLIMETRE"},
-            )
-
-            # Create site
-            site = ifcopenshell.api.run(
-                "root.create_entity", self.model, ifc_class="IfcSite", name="Site"
+            # IFC2X3 requires an owner history on every rooted entity
+            owner_history = (
+                self._create_owner_history(model) if model.schema == "IFC2X3" else None
             )
 
-            # Create building
-            building = ifcopenshell.api.run(
-                "root.create_entity",
-                self.model,
-                ifc_class="IfcBuilding",
-                name="Building",
-            )
+            def create(ifc_class: str, **attributes: Any) -> Any:
+                return model.create_entity(
+                    ifc_class,
+                    GlobalId=new_guid(),
+                    OwnerHistory=owner_history,
+                    **attributes,
+                )
 
-            # Create building storey
-            storey = ifcopenshell.api.run(
-                "root.create_entity",
-                self.model,
-                ifc_class="IfcBuildingStorey",
-                name="Ground Floor",
+            # Create the spatial elements directly rather than through api.run
+            project = create("IfcProject", Name="Structural Engineering Project")
+            site = create("IfcSite", Name="Site", CompositionType="ELEMENT")
+            building = create("IfcBuilding", Name="Building", CompositionType="ELEMENT")
+            storey = create(
+                "IfcBuildingStorey", Name="Ground Floor", CompositionType="ELEMENT"
             )
 
             # Create spatial hierarchy
+            for parent, child in (
+                (project, site),
+                (site, building),
+                (building, storey),
+            ):
+                create(
+                    "IfcRelAggregates", RelatingObject=parent, RelatedObjects=(child,)
+                )
+
+            # Create the model representation context and units
+            ifcopenshell.api.run("context.add_context", model, context_type="Model")
             ifcopenshell.api.run(
-                "aggregate.assign_object",
-                self.model,
-                relating_object=project,
-                related_object=site,
-            )
-            ifcopenshell.api.run(
-                "aggregate.assign_object",
-                self.model,
-                relating_object=site,
-                related_object=building,
-            )
-            ifcopenshell.api.run(
-                "aggregate.assign_object",
-                self.model,
-                relating_object=building,
-                related_object=storey,
+                "unit.assign_unit",
+                model,
+                length={"is_metric": True, "raw": "MILLIMETRE"},
             )
 
             self.logger.debug("Created basic IFC project structure")
@@ -194,10 +258,112 @@ class IFCManager:
         except Exception as e:
             self.logger.warning(f"Failed to create basic structure: {e}")
 
+    def _create_owner_history(self, model: "ifcopenshell.file") -> Any:
+        """Create an owner history identifying this application in model."""
+        create = model.create_entity
+
+        organization = create("IfcOrganization", Name="Engineering Structural Tools")
+        user = create(
+            "IfcPersonAndOrganization",
+            ThePerson=create("IfcPerson", FamilyName="Unknown"),
+            TheOrganization=organization,
+        )
+        application = create(
+            "IfcApplication",
+            ApplicationDeveloper=organization,
+            Version="0.1.0",
+            ApplicationFullName="Engineering Structural Tools",
+            ApplicationIdentifier="eng-struct-tools",
+        )
+
+        return create(
+            "IfcOwnerHistory",
+            OwningUser=user,
+            OwningApplication=application,
+            ChangeAction="ADDED",
+            CreationDate=int(datetime.now().timestamp()),
+        )
+
+    def _require_editable_model(self) -> None:
+        """Raise IFCError if the current model was loaded in streaming mode."""
+        if self._streaming:
+            raise IFCError("IFC model was loaded in streaming mode and is read-only")
+
+    def _require_full_model(self, operation: str) -> None:
+        """Raise IFCError if operation is unsupported on a streamed model."""
+        if self._streaming:
+            raise IFCError(f"{operation} is not supported in streaming mode")
+
+    def _invalidate_type_cache(self) -> None:
+        """Discard cached by_type results and project units after the model changes."""
+        self._type_cache.clear()
+        self._unit_cache.clear()
+
+    def _get_project_unit(self, unit_type: str) -> Any:
+        """
+        Get a project unit of the current model, using the unit cache.
+
+        Args:
+            unit_type: IFC unit type (e.g., "LENGTHUNIT")
+
+        Returns:
+            IFC unit entity, or None if the project does not define it
+        """
+        self._require_full_model("Reading project units")
+
+        if unit_type not in self._unit_cache:
+            if self.model is not None and self.get_elements_by_type("IfcProject"):
+                unit = ifcopenshell.util.unit.get_project_unit(self.model, unit_type)
+            else:
+                unit = None
+            self._unit_cache[unit_type] = unit
+        return self._unit_cache[unit_type]
+
+    def _get_psets(self, element: Any) -> Dict[str, Dict[str, Any]]:
+        """Return the property sets of an element, using the pset cache."""
+        element_id = element.id()
+        psets = self._pset_cache.get(element_id)
+
+        if psets is None:
+            psets = ifcopenshell.util.element.get_psets(element)
+            self._pset_cache[element_id] = psets
+            if len(self._pset_cache) > self.PSET_CACHE_SIZE:
+                self._pset_cache.popitem(last=False)
+        else:
+            self._pset_cache.move_to_end(element_id)
+
+        return psets
+
+    def flush_pset_cache(self) -> None:
+        """
+        Discard all cached property sets.
+
+        Call this after editing property sets through ifcopenshell directly
+        rather than through this manager.
+        """
+        self._pset_cache.clear()
+
+    def flush_caches(self) -> None:
+        """
+        Discard all cached query results for the current model.
+
+        This clears the by_type, project unit, property set and GUID caches.
+        Call it after changing the model through ifcopenshell directly, e.g.
+        removing elements via ``model.remove``, rather than through this
+        manager.
+        """
+        self._invalidate_type_cache()
+        self.flush_pset_cache()
+        self._guid_cache.clear()
+
     def get_elements_by_type(self, ifc_type: str) -> List[Any]:
         """
         Get all elements of a specific IFC type.
 
+        Results are cached per model until it is modified through this
+        manager; the returned list is shared and should not be mutated. Call
+        flush_caches() after modifying the model through ifcopenshell directly.
+
         Args:
             ifc_type: IFC type name (e.g., "IfcBeam", "IfcColumn")
 
@@ -208,7 +374,11 @@ class IFCManager:
             raise IFCError("No IFC model loaded")
 
         try:
-            return self.model.by_type(ifc_type)
+            cached = self._type_cache.get(ifc_type)
+            if cached is None:
+                cached = list(self.model.by_type(ifc_type))
+                self._type_cache[ifc_type] = cached
+            return cached
         except Exception as e:
             self.logger.error(f"Failed to get elements by type {ifc_type}: {e}")
             return []
@@ -225,9 +395,24 @@ class IFCManager:
         """
         if self.model is None:
             raise IFCError("No IFC model loaded")
+        self._require_full_model("Lookup by GUID")
 
         try:
-            return self.model.by_guid(guid)
+            step_id = self._guid_cache.get(guid)
+            if step_id is not None:
+                try:
+                    element = self.model.by_id(step_id)
+                    self._guid_cache.move_to_end(guid)
+                    return element
+                except RuntimeError:
+                    # Element was removed since it was cached
+                    del self._guid_cache[guid]
+
+            element = self.model.by_guid(guid)
+            self._guid_cache[guid] = element.id()
+            if len(self._guid_cache) > self.GUID_CACHE_SIZE:
+                self._guid_cache.popitem(last=False)
+            return element
         except Exception as e:
             self.logger.error(f"Failed to get element by GUID {guid}: {e}")
             return None
@@ -248,19 +433,13 @@ class IFCManager:
         """
         if self.model is None:
             raise IFCError("No IFC model loaded")
+        self._require_editable_model()
 
         try:
-            # Map element types to IFC classes
-            type_mapping = {
-                "beam": "IfcBeam",
-                "column": "IfcColumn",
-                "footing": "IfcFooting",
-                "slab": "IfcSlab",
-                "wall": "IfcWall",
-                "member": "IfcMember",
-            }
-
-            ifc_class = type_mapping.get(element_type.lower(), "IfcBuildingElement")
+            # Map element types to IFC classes, lowering only non-canonical names
+            ifc_class = _TYPE_MAPPING.get(element_type) or _TYPE_MAPPING.get(
+                element_type.lower(), "IfcBuildingElement"
+            )
 
             # Create element
             element = ifcopenshell.api.run(
@@ -271,6 +450,8 @@ class IFCManager:
             if properties:
                 self._add_properties_to_element(element, properties)
 
+            self._invalidate_type_cache()
+
             self.logger.info(f"Created {element_type} element: {name}")
             return element
 
@@ -291,45 +472,63 @@ class IFCManager:
                 name="Structural_Properties",
             )
 
-            # Add properties
-            for prop_name, prop_value in properties.items():
-                ifcopenshell.api.run(
-                    "pset.edit_pset",
-                    self.model,
-                    pset=pset,
-                    properties={prop_name: prop_value},
-                )
+            # Add all properties in a single edit
+            ifcopenshell.api.run(
+                "pset.edit_pset",
+                self.model,
+                pset=pset,
+                properties=properties,
+            )
+            self._invalidate_type_cache()
+            self._pset_cache.pop(element.id(), None)
 
         except Exception as e:
             self.logger.warning(f"Failed to add properties to element: {e}")
 
-    def get_element_properties(self, element: Any) -> Dict[str, Any]:
+    def get_element_properties(self, element: Any) -> Dict[str, Dict[str, Any]]:
         """
-        Get properties of an IFC element.
+        Get properties of an IFC element grouped by property set.
 
         Args:
             element: IFC element
 
         Returns:
-            Dictionary of properties
+            Dictionary mapping property set names to their properties
         """
-        try:
-            properties = {}
-
-            # Get property sets
-            psets = ifcopenshell.util.element.get_psets(element)
-
-            for pset_name, pset_data in psets.items():
-                for prop_name, prop_value in pset_data.items():
-                    if prop_name not in ["id", "type"]:
-                        properties[f"{pset_name}.{prop_name}"] = prop_value
+        self._require_full_model("Reading element properties")
 
-            return properties
+        try:
+            psets = self._get_psets(element)
+
+            return {
+                pset_name: {
+                    prop_name: prop_value
+                    for prop_name, prop_value in pset_data.items()
+                    if prop_name not in _RESERVED_PSET_KEYS
+                }
+                for pset_name, pset_data in psets.items()
+            }
 
         except Exception as e:
             self.logger.error(f"Failed to get element properties: {e}")
             return {}
 
+    def get_element_properties_flat(self, element: Any) -> Dict[str, Any]:
+        """
+        Get properties of an IFC element keyed by "PsetName.PropertyName".
+
+        Args:
+            element: IFC element
+
+        Returns:
+            Dictionary of properties
+        """
+        return {
+            f"{pset_name}.{prop_name}": prop_value
+            for pset_name, pset_data in self.get_element_properties(element).items()
+            for prop_name, prop_value in pset_data.items()
+        }
+
     def update_element_property(
         self,
         element: Any,
@@ -346,9 +545,11 @@ class IFCManager:
             value: New property value
             pset_name: Property set name
         """
+        self._require_editable_model()
+
         try:
             # Get or create property set
-            psets = ifcopenshell.util.element.get_psets(element)
+            psets = self._get_psets(element)
 
             if pset_name in psets:
                 pset = self.model.by_id(psets[pset_name]["id"])
@@ -357,13 +558,15 @@ class IFCManager:
                     "pset.add_pset", self.model, product=element, name=pset_name
                 )
 
-            # Update property
+            # Update property; this may also create new property entities
             ifcopenshell.api.run(
                 "pset.edit_pset",
                 self.model,
                 pset=pset,
                 properties={property_name: value},
             )
+            self._invalidate_type_cache()
+            self._pset_cache.pop(element.id(), None)
 
             self.logger.debug(f"Updated property {property_name} = {value}")
 
@@ -374,6 +577,9 @@ class IFCManager:
         """
         Get information about the current IFC model.
 
+        Units are not read from models loaded in streaming mode; the
+        "streaming" entry tells callers when they were skipped.
+
         Returns:
             Dictionary with model information
         """
@@ -384,25 +590,23 @@ class IFCManager:
             info = {
                 "schema": self.model.schema,
                 "file_path": str(self.file_path) if self.file_path else None,
-                "element_count": len(self.model.by_type("IfcRoot")),
+                "element_count": len(self.get_elements_by_type("IfcRoot")),
                 "project_name": None,
                 "units": {},
+                "streaming": self._streaming,
             }
 
             # Get project name
-            projects = self.model.by_type("IfcProject")
+            projects = self.get_elements_by_type("IfcProject")
             if projects:
                 info["project_name"] = projects[0].Name
 
-            # Get units
-            try:
-                units = ifcopenshell.util.unit.get_project_unit(
-                    self.model, "LENGTHUNIT"
-                )
-                if units:
-                    info["units"]["length"] = units.Name
-            except:
-                pass
+                # Get units; unit lookups are unsupported on streamed models
+                if not self._streaming:
+                    length_unit = self._get_project_unit("LENGTHUNIT")
+                    unit_name = getattr(length_unit, "Name", None)
+                    if unit_name:
+                        info["units"]["length"] = unit_name
 
             return info
 
@@ -419,24 +623,19 @@ class IFCManager:
         """
         if self.model is None:
             return False, ["No model loaded"]
+        self._require_full_model("Model validation")
 
         issues = []
 
         try:
-            # Check for required elements
-            projects = self.model.by_type("IfcProject")
-            if not projects:
-                issues.append("No IfcProject found")
+            # Check for required elements; units live on the project, so
+            # without one there is nothing further to check
+            if not self.get_elements_by_type("IfcProject"):
+                return False, ["No IfcProject found", "No length unit defined"]
 
             # Check for units
-            try:
-                length_unit = ifcopenshell.util.unit.get_project_unit(
-                    self.model, "LENGTHUNIT"
-                )
-                if not length_unit:
-                    issues.append("No length unit defined")
-            except:
-                issues.append("Error checking units")
+            if not self._get_project_unit("LENGTHUNIT"):
+                issues.append("No length unit defined")
 
             # Additional validation can be added here
 
@@ -448,5 +647,28 @@ class IFCManager:
             return False, [f"Validation error: {e}"]
 
 
-# Global IFC manager instance
-ifc_manager = IFCManager() if IFC_AVAILABLE else None
+_ifc_manager: Optional[IFCManager] = None
+
+
+def get_ifc_manager() -> Optional[IFCManager]:
+    """
+    Get the shared IFC manager, creating it on first use.
+
+    Returns:
+        Shared IFCManager instance, or None if ifcopenshell is not available
+    """
+    global _ifc_manager
+
+    if _ifc_manager is None and IFC_AVAILABLE:
+        try:
+            _ifc_manager = IFCManager()
+        except IFCError as e:
+            logging.getLogger(__name__).error(f"IFC support unavailable: {e}")
+    return _ifc_manager
+
+
+def __getattr__(name: str) -> Any:
+    """Provide the shared IFC manager as ``ifc_manager`` on first access."""
+    if name == "ifc_manager":
+        return get_ifc_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
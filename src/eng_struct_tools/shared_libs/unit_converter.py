@@ -5,14 +5,128 @@ This module provides comprehensive unit conversion capabilities using the
 pint library, with predefined unit systems for structural engineering.
 """
 
+import functools
 import logging
-from typing import Dict, List, Optional, Union, Any
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    Any,
+)
 from decimal import Decimal
-import pint
+from enum import IntEnum
+from types import MappingProxyType
 
-# Initialize pint unit registry
-ureg = pint.UnitRegistry()
-ureg.default_format = "~P"  # Pretty format
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    import pint
+
+
+@functools.cache
+def _get_ureg() -> "pint.UnitRegistry":
+    """
+    Get the shared pint unit registry, creating it on first use.
+
+    Building the registry parses pint's full definitions file, so it is
+    deferred until a unit operation actually needs it. The parsed definitions
+    are kept in pint's on-disk cache so later sessions start faster.
+    """
+    import pint
+
+    try:
+        registry = pint.UnitRegistry(cache_folder=":auto:")
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Unit definition cache unavailable: {e}")
+        registry = pint.UnitRegistry()
+    registry.default_format = "~P"  # Pretty format
+
+    # Unit aliases for common engineering units, defined once per registry
+    try:
+        registry.define("ksi = 1000 * psi")
+        registry.define("ksf = 1000 * psf")
+        registry.define("pcf = pound / foot**3")
+        registry.define("psf = pound_force / foot**2")
+    except pint.errors.PintError as e:
+        logging.getLogger(__name__).warning(f"Could not define unit aliases: {e}")
+
+    return registry
+
+
+@functools.lru_cache(maxsize=1024)
+def _factor(from_unit: str, to_unit: str) -> Optional[float]:
+    """
+    Get the multiplicative factor converting from_unit to to_unit.
+
+    Factors depend only on the shared registry, so they are cached once for
+    all converter instances.
+
+    Args:
+        from_unit: Source unit
+        to_unit: Target unit
+
+    Returns:
+        Conversion factor, or None for temperature units whose
+        conversion may include an offset (e.g. °C to °F)
+    """
+    ureg = _get_ureg()
+    if "[temperature]" in ureg.get_dimensionality(from_unit):
+        return None
+
+    return float(ureg.Quantity(1.0, from_unit).to(to_unit).magnitude)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse(unit_string: str) -> Any:
+    """
+    Parse a unit expression against the shared registry.
+
+    Parsed expressions are cached for all converter instances; parse errors
+    are raised and not cached.
+
+    Args:
+        unit_string: Unit expression to parse
+
+    Returns:
+        Parsed pint quantity
+    """
+    return _get_ureg().parse_expression(unit_string)
+
+
+class QuantityType(IntEnum):
+    """
+    Quantity types known to the predefined unit systems.
+
+    Members index directly into a unit system's unit table, so hot code can
+    use them instead of quantity type strings.
+    """
+
+    LENGTH = 0
+    AREA = 1
+    VOLUME = 2
+    FORCE = 3
+    MOMENT = 4
+    STRESS = 5
+    PRESSURE = 6
+    DENSITY = 7
+    MASS = 8
+    TIME = 9
+    TEMPERATURE = 10
+    ANGLE = 11
+    FREQUENCY = 12
+    VELOCITY = 13
+    ACCELERATION = 14
+
+
+# Quantity type strings mapped to their enum members
+QUANTITY_TYPES: Dict[str, QuantityType] = {qt.name.lower(): qt for qt in QuantityType}
 
 
 class UnitSystem:
@@ -20,6 +134,8 @@ class UnitSystem:
     Represents a consistent unit system for structural engineering.
     """
 
+    __slots__ = ("name", "units", "_units_by_type")
+
     def __init__(self, name: str, units: Dict[str, str]):
         """
         Initialize a unit system.
@@ -29,11 +145,25 @@ class UnitSystem:
             units: Dictionary mapping quantity types to unit strings
         """
         self.name = name
-        self.units = units
+        # Read-only copy, so systems shared at class level cannot be mutated
+        self.units: Mapping[str, str] = MappingProxyType(dict(units))
+
+        # Units indexed by QuantityType for lookups without string hashing
+        self._units_by_type: Tuple[str, ...] = tuple(
+            units.get(quantity_type, "dimensionless")
+            for quantity_type in QUANTITY_TYPES
+        )
 
     def get_unit(self, quantity_type: str) -> str:
         """Get the unit for a specific quantity type."""
-        return self.units.get(quantity_type, "dimensionless")
+        try:
+            return self.units[quantity_type]
+        except KeyError:
+            return "dimensionless"
+
+    def get_unit_by_type(self, quantity_type: QuantityType) -> str:
+        """Get the unit for a QuantityType member."""
+        return self._units_by_type[quantity_type]
 
     def __str__(self) -> str:
         return f"UnitSystem({self.name})"
@@ -48,88 +178,112 @@ class UnitConverter:
     """
 
     # Predefined unit systems
-    UNIT_SYSTEMS = {
-        "SI": UnitSystem(
-            "SI (Metric)",
-            {
-                "length": "m",
-                "area": "m²",
-                "volume": "m³",
-                "force": "N",
-                "moment": "N⋅m",
-                "stress": "Pa",
-                "pressure": "Pa",
-                "density": "kg/m³",
-                "mass": "kg",
-                "time": "s",
-                "temperature": "°C",
-                "angle": "rad",
-                "frequency": "Hz",
-                "velocity": "m/s",
-                "acceleration": "m/s²",
-            },
-        ),
-        "SI_Engineering": UnitSystem(
-            "SI Engineering",
-            {
-                "length": "mm",
-                "area": "mm²",
-                "volume": "mm³",
-                "force": "N",
-                "moment": "N⋅mm",
-                "stress": "MPa",
-                "pressure": "MPa",
-                "density": "kg/m³",
-                "mass": "kg",
-                "time": "s",
-                "temperature": "°C",
-                "angle": "rad",
-                "frequency": "Hz",
-                "velocity": "mm/s",
-                "acceleration": "mm/s²",
-            },
-        ),
-        "Imperial": UnitSystem(
-            "Imperial (US)",
-            {
-                "length": "ft",
-                "area": "ft²",
-                "volume": "ft³",
-                "force": "lbf",
-                "moment": "lbf⋅ft",
-                "stress": "psi",
-                "pressure": "psi",
-                "density": "lb/ft³",
-                "mass": "lb",
-                "time": "s",
-                "temperature": "°F",
-                "angle": "rad",
-                "frequency": "Hz",
-                "velocity": "ft/s",
-                "acceleration": "ft/s²",
-            },
-        ),
-        "Imperial_Engineering": UnitSystem(
-            "Imperial Engineering",
-            {
-                "length": "in",
-                "area": "in²",
-                "volume": "in³",
-                "force": "lbf",
-                "moment": "lbf⋅in",
-                "stress": "ksi",
-                "pressure": "ksi",
-                "density": "lb/in³",
-                "mass": "lb",
-                "time": "s",
-                "temperature": "°F",
-                "angle": "rad",
-                "frequency": "Hz",
-                "velocity": "in/s",
-                "acceleration": "in/s²",
-            },
-        ),
-    }
+    UNIT_SYSTEMS: Mapping[str, UnitSystem] = MappingProxyType(
+        {
+            "SI": UnitSystem(
+                "SI (Metric)",
+                {
+                    "length": "m",
+                    "area": "m²",
+                    "volume": "m³",
+                    "force": "N",
+                    "moment": "N⋅m",
+                    "stress": "Pa",
+                    "pressure": "Pa",
+                    "density": "kg/m³",
+                    "mass": "kg",
+                    "time": "s",
+                    "temperature": "°C",
+                    "angle": "rad",
+                    "frequency": "Hz",
+                    "velocity": "m/s",
+                    "acceleration": "m/s²",
+                },
+            ),
+            "SI_Engineering": UnitSystem(
+                "SI Engineering",
+                {
+                    "length": "mm",
+                    "area": "mm²",
+                    "volume": "mm³",
+                    "force": "N",
+                    "moment": "N⋅mm",
+                    "stress": "MPa",
+                    "pressure": "MPa",
+                    "density": "kg/m³",
+                    "mass": "kg",
+                    "time": "s",
+                    "temperature": "°C",
+                    "angle": "rad",
+                    "frequency": "Hz",
+                    "velocity": "mm/s",
+                    "acceleration": "mm/s²",
+                },
+            ),
+            "Imperial": UnitSystem(
+                "Imperial (US)",
+                {
+                    "length": "ft",
+                    "area": "ft²",
+                    "volume": "ft³",
+                    "force": "lbf",
+                    "moment": "lbf⋅ft",
+                    "stress": "psi",
+                    "pressure": "psi",
+                    "density": "lb/ft³",
+                    "mass": "lb",
+                    "time": "s",
+                    "temperature": "°F",
+                    "angle": "rad",
+                    "frequency": "Hz",
+                    "velocity": "ft/s",
+                    "acceleration": "ft/s²",
+                },
+            ),
+            "Imperial_Engineering": UnitSystem(
+                "Imperial Engineering",
+                {
+                    "length": "in",
+                    "area": "in²",
+                    "volume": "in³",
+                    "force": "lbf",
+                    "moment": "lbf⋅in",
+                    "stress": "ksi",
+                    "pressure": "ksi",
+                    "density": "lb/in³",
+                    "mass": "lb",
+                    "time": "s",
+                    "temperature": "°F",
+                    "angle": "rad",
+                    "frequency": "Hz",
+                    "velocity": "in/s",
+                    "acceleration": "in/s²",
+                },
+            ),
+        }
+    )
+
+    # Names of the predefined systems, in definition order
+    _AVAILABLE_SYSTEMS: Tuple[str, ...] = tuple(UNIT_SYSTEMS)
+
+    # Common units per quantity type, shared by all instances
+    _COMMON_UNITS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+        {
+            "length": ("mm", "cm", "m", "km", "in", "ft", "yd", "mile"),
+            "area": ("mm²", "cm²", "m²", "km²", "in²", "ft²", "yd²"),
+            "volume": ("mm³", "cm³", "m³", "in³", "ft³", "yd³"),
+            "force": ("N", "kN", "MN", "lbf", "kip"),
+            "moment": ("N⋅mm", "N⋅m", "kN⋅m", "lbf⋅in", "lbf⋅ft", "kip⋅ft"),
+            "stress": ("Pa", "kPa", "MPa", "GPa", "psi", "ksi"),
+            "pressure": ("Pa", "kPa", "MPa", "psi", "psf"),
+            "density": ("kg/m³", "g/cm³", "lb/ft³", "lb/in³"),
+            "mass": ("g", "kg", "tonne", "lb", "ton"),
+            "temperature": ("°C", "°F", "K"),
+            "angle": ("rad", "deg", "grad"),
+            "velocity": ("m/s", "km/h", "ft/s", "mph"),
+            "acceleration": ("m/s²", "ft/s²", "g"),
+        }
+    )
 
     def __init__(self, default_system: str = "SI_Engineering"):
         """
@@ -140,24 +294,26 @@ class UnitConverter:
         """
         self.logger = logging.getLogger(__name__)
         self.current_system = default_system
-        self.ureg = ureg
+        self._ureg: Optional["pint.UnitRegistry"] = None
+
+        # Conversion functions built from the cached factors, per unit pair
+        self._converter_cache: Dict[Tuple[str, str], Callable[[Any], Any]] = {}
 
-        # Unit aliases for common engineering units
-        self._setup_aliases()
+        # Display strings for units, as rendered by format_value_with_unit
+        self._pretty_unit_cache: Dict[str, str] = {}
+
+        # Unit strings that failed to parse, so validation can reject them cheaply
+        self._invalid_units: Set[str] = set()
 
         self.logger.info(f"Unit converter initialized with {default_system} system")
 
-    def _setup_aliases(self) -> None:
-        """Set up unit aliases for common engineering units."""
-        try:
-            # Define common aliases
-            self.ureg.define("ksi = 1000 * psi")
-            self.ureg.define("ksf = 1000 * psf")
-            self.ureg.define("pcf = pound / foot**3")
-            self.ureg.define("psf = pound * force / foot**2")
+    @property
+    def ureg(self) -> "pint.UnitRegistry":
+        """Shared pint unit registry, created on first use."""
+        if self._ureg is None:
+            self._ureg = _get_ureg()
 
-        except Exception as e:
-            self.logger.warning(f"Some unit aliases may already exist: {e}")
+        return self._ureg
 
     def get_current_system(self) -> UnitSystem:
         """Get the current unit system."""
@@ -178,7 +334,7 @@ class UnitConverter:
 
     def get_available_systems(self) -> List[str]:
         """Get list of available unit system names."""
-        return list(self.UNIT_SYSTEMS.keys())
+        return list(self._AVAILABLE_SYSTEMS)
 
     def convert(
         self, value: Union[float, int, Decimal], from_unit: str, to_unit: str
@@ -195,13 +351,7 @@ class UnitConverter:
             Converted value
         """
         try:
-            # Create quantity with source unit
-            quantity = self.ureg.Quantity(value, from_unit)
-
-            # Convert to target unit
-            converted = quantity.to(to_unit)
-
-            return float(converted.magnitude)
+            return float(self._get_converter(from_unit, to_unit)(float(value)))
 
         except Exception as e:
             self.logger.error(
@@ -209,6 +359,81 @@ class UnitConverter:
             )
             raise ValueError(f"Cannot convert {from_unit} to {to_unit}: {e}")
 
+    def convert_array(
+        self, values: npt.ArrayLike, from_unit: str, to_unit: str
+    ) -> np.ndarray:
+        """
+        Convert an array of values from one unit to another.
+
+        The conversion is applied to the whole array at once rather than
+        building a pint quantity per element.
+
+        Args:
+            values: Values to convert (array or sequence)
+            from_unit: Source unit
+            to_unit: Target unit
+
+        Returns:
+            Converted values as a float64 array
+        """
+        arr = np.asarray(values, dtype=np.float64)
+
+        try:
+            converter = self._get_converter(from_unit, to_unit)
+        except Exception as e:
+            self.logger.error(f"Unit conversion failed: {from_unit} -> {to_unit}: {e}")
+            raise ValueError(f"Cannot convert {from_unit} to {to_unit}: {e}")
+
+        return np.asarray(converter(arr), dtype=np.float64)
+
+    def _get_converter(self, from_unit: str, to_unit: str) -> Callable[[Any], Any]:
+        """
+        Get a function converting values from from_unit to to_unit.
+
+        The function is built once per unit pair and works on floats as well
+        as NumPy arrays.
+
+        Args:
+            from_unit: Source unit
+            to_unit: Target unit
+
+        Returns:
+            Conversion function
+        """
+        key = (from_unit, to_unit)
+        converter = self._converter_cache.get(key)
+        if converter is not None:
+            return converter
+
+        factor = _factor(from_unit, to_unit)
+        if factor is not None:
+
+            def converter(value: Any) -> Any:
+                return value * factor
+
+        else:
+            # Offset units convert linearly as value * scale + offset; the
+            # scale is taken over a wide span to limit rounding error
+            magnitude: np.ndarray = (
+                self.ureg.Quantity([0.0, 1e6], from_unit).to(to_unit).magnitude
+            )
+            offset = float(magnitude[0])
+            scale = (float(magnitude[1]) - offset) / 1e6
+
+            def converter(value: Any) -> Any:
+                return value * scale + offset
+
+        self._converter_cache[key] = converter
+        return converter
+
+    def _parse_unit(self, unit_string: str) -> Any:
+        """Parse a unit expression, remembering strings that fail."""
+        try:
+            return _parse(unit_string)
+        except Exception:
+            self._invalid_units.add(unit_string)
+            raise
+
     def convert_to_system(
         self,
         value: Union[float, int, Decimal],
@@ -231,12 +456,35 @@ class UnitConverter:
         if target_system is None:
             target_system = self.current_system
 
-        if target_system not in self.UNIT_SYSTEMS:
-            raise ValueError(f"Unknown unit system: {target_system}")
+        target_unit = _FLAT_UNIT_TABLE.get((target_system, quantity_type))
+        if target_unit is None:
+            # Unknown system (raises) or quantity type (dimensionless)
+            target_unit = self.get_unit_for_quantity(quantity_type, target_system)
 
-        target_unit = self.UNIT_SYSTEMS[target_system].get_unit(quantity_type)
         return self.convert(value, from_unit, target_unit)
 
+    def convert_to_system_array(
+        self,
+        values: npt.ArrayLike,
+        from_unit: str,
+        quantity_type: str,
+        target_system: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Convert an array of values to the unit of a quantity type in a system.
+
+        Args:
+            values: Values to convert (array or sequence)
+            from_unit: Source unit
+            quantity_type: Type of quantity (e.g., 'length', 'force')
+            target_system: Target unit system (uses current if None)
+
+        Returns:
+            Converted values as a float64 array
+        """
+        target_unit = self.get_unit_for_quantity(quantity_type, target_system)
+        return self.convert_array(values, from_unit, target_unit)
+
     def get_unit_for_quantity(
         self, quantity_type: str, system: Optional[str] = None
     ) -> str:
@@ -253,6 +501,10 @@ class UnitConverter:
         if system is None:
             system = self.current_system
 
+        unit = _FLAT_UNIT_TABLE.get((system, quantity_type))
+        if unit is not None:
+            return unit
+
         if system not in self.UNIT_SYSTEMS:
             raise ValueError(f"Unknown unit system: {system}")
 
@@ -268,8 +520,11 @@ class UnitConverter:
         Returns:
             True if valid, False otherwise
         """
+        if unit_string in self._invalid_units:
+            return False
+
         try:
-            self.ureg.parse_expression(unit_string)
+            self._parse_unit(unit_string)
             return True
         except Exception:
             return False
@@ -285,7 +540,7 @@ class UnitConverter:
             Dimension string
         """
         try:
-            quantity = self.ureg.parse_expression(unit_string)
+            quantity = self._parse_unit(unit_string)
             return str(quantity.dimensionality)
         except Exception as e:
             self.logger.error(f"Cannot get dimensions for unit {unit_string}: {e}")
@@ -302,10 +557,13 @@ class UnitConverter:
         Returns:
             True if compatible, False otherwise
         """
+        if unit1 in self._invalid_units or unit2 in self._invalid_units:
+            return False
+
         try:
-            q1 = self.ureg.parse_expression(unit1)
-            q2 = self.ureg.parse_expression(unit2)
-            return q1.dimensionality == q2.dimensionality
+            q1 = self._parse_unit(unit1)
+            q2 = self._parse_unit(unit2)
+            return bool(q1.dimensionality == q2.dimensionality)
         except Exception:
             return False
 
@@ -323,11 +581,15 @@ class UnitConverter:
         Returns:
             Formatted string
         """
-        try:
-            quantity = self.ureg.Quantity(value, unit)
-            return f"{value:.{precision}f} {quantity.units:~P}"
-        except Exception:
-            return f"{value:.{precision}f} {unit}"
+        pretty_unit = self._pretty_unit_cache.get(unit)
+        if pretty_unit is None:
+            try:
+                pretty_unit = f"{self.ureg.Unit(unit):~P}"
+            except Exception:
+                pretty_unit = unit
+            self._pretty_unit_cache[unit] = pretty_unit
+
+        return f"{value:.{precision}f} {pretty_unit}"
 
     def get_common_units_for_quantity(self, quantity_type: str) -> List[str]:
         """
@@ -339,24 +601,23 @@ class UnitConverter:
         Returns:
             List of common unit strings
         """
-        common_units = {
-            "length": ["mm", "cm", "m", "km", "in", "ft", "yd", "mile"],
-            "area": ["mm²", "cm²", "m²", "km²", "in²", "ft²", "yd²"],
-            "volume": ["mm³", "cm³", "m³", "in³", "ft³", "yd³"],
-            "force": ["N", "kN", "MN", "lbf", "kip"],
-            "moment": ["N⋅mm", "N⋅m", "kN⋅m", "lbf⋅in", "lbf⋅ft", "kip⋅ft"],
-            "stress": ["Pa", "kPa", "MPa", "GPa", "psi", "ksi"],
-            "pressure": ["Pa", "kPa", "MPa", "psi", "psf"],
-            "density": ["kg/m³", "g/cm³", "lb/ft³", "lb/in³"],
-            "mass": ["g", "kg", "tonne", "lb", "ton"],
-            "temperature": ["°C", "°F", "K"],
-            "angle": ["rad", "deg", "grad"],
-            "velocity": ["m/s", "km/h", "ft/s", "mph"],
-            "acceleration": ["m/s²", "ft/s²", "g"],
-        }
-
-        return common_units.get(quantity_type, [])
-
-
-# Global unit converter instance
-unit_converter = UnitConverter()
+        return list(self._COMMON_UNITS.get(quantity_type, ()))
+
+
+# Units keyed by (system name, quantity type) for single-lookup access
+_FLAT_UNIT_TABLE: Dict[Tuple[str, str], str] = {
+    (system_name, quantity_type): unit
+    for system_name, system in UnitConverter.UNIT_SYSTEMS.items()
+    for quantity_type, unit in system.units.items()
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create the module-level registry and converter on first access."""
+    if name == "ureg":
+        return _get_ureg()
+    if name == "unit_converter":
+        # Global unit converter instance
+        converter = globals()["unit_converter"] = UnitConverter()
+        return converter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,142 @@
+"""
+Unit tests for the common UI widgets.
+
+This module contains tests for the reusable input and parameter widgets,
+run against Qt's offscreen platform.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import Qt
+
+from src.eng_struct_tools.shared_libs.common_ui_widgets import (
+    LabeledInput,
+    ParameterGroup,
+    ResultsTable,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qapp():
+    """Application instance required before creating widgets."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestParameterGroup:
+    """Test cases for ParameterGroup."""
+    
+    def test_large_range_uses_line_edit(self):
+        """Test that only wide double ranges switch to 'double_large'."""
+        group = ParameterGroup("Loads")
+        
+        wide = group.add_parameter(
+            "axial_load", "Axial Load", "double", 100.0, range_values=(0, 1e9)
+        )
+        narrow = group.add_parameter(
+            "length", "Length", "double", 1.0, range_values=(0, 1000)
+        )
+        unbounded = group.add_parameter("width", "Width", "double", 1.0)
+        
+        assert wide.input_type == "double_large"
+        assert isinstance(wide.input_widget, QtWidgets.QLineEdit)
+        assert narrow.input_type == "double"
+        assert isinstance(narrow.input_widget, QtWidgets.QDoubleSpinBox)
+        assert unbounded.input_type == "double"
+        assert group.get_values() == {
+            "axial_load": 100.0,
+            "length": 1.0,
+            "width": 1.0,
+        }
+
+
+class TestLargeDoubleInput:
+    """Test cases for LabeledInput with the 'double_large' input type."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.widget = LabeledInput("Axial Load", "double_large")
+        self.widget.set_range(0, 1e9)
+    
+    @pytest.mark.parametrize("text", ["", "-", "1,5"])
+    def test_get_value_unparsable_text(self, text):
+        """Test that empty, intermediate and separator text reads as zero."""
+        self.widget.input_widget.setText(text)
+        assert self.widget.get_value() == 0.0
+    
+    def test_group_separator_rejected(self):
+        """Test that typed group separators are rejected by the validator."""
+        self.widget.input_widget.insert("1,500,000")
+        assert self.widget.input_widget.text() == ""
+    
+    @pytest.mark.parametrize("text,expected", [("5000000000", 1e9), ("-5", 0.0)])
+    def test_get_value_clamps_out_of_range(self, text, expected):
+        """Test that out-of-range text is clamped to the range."""
+        self.widget.input_widget.setText(text)
+        assert self.widget.get_value() == expected
+    
+    def test_set_value_round_trip(self):
+        """Test that set_value keeps all allowed decimals."""
+        self.widget.set_value(123456789.125)
+        
+        assert self.widget.input_widget.text() == "123456789.125"
+        assert self.widget.get_value() == 123456789.125
+    
+    def test_set_value_trims_trailing_zeros(self):
+        """Test that whole values are shown without trailing decimals."""
+        self.widget.set_value(2.0)
+        assert self.widget.input_widget.text() == "2"
+
+
+def _table_cells(table):
+    """Return the table contents as a list of row text lists."""
+    return [
+        [table.item(row, col).text() for col in range(table.columnCount())]
+        for row in range(table.rowCount())
+    ]
+
+
+class TestResultsTable:
+    """Test cases for ResultsTable."""
+    
+    def test_set_data_reuses_items(self):
+        """Test item reuse across clears, header changes and row count changes."""
+        table = ResultsTable()
+        table.set_data([{"Check": "Bearing", "Result": "OK"}])
+        item = table.item(0, 0)
+        
+        # Same headers reuse the existing items
+        table.set_data([{"Check": "Punching", "Result": "FAIL"}])
+        assert table.item(0, 0) is item
+        assert _table_cells(table) == [["Punching", "FAIL"]]
+        
+        # Cleared rows are rebuilt without stale cells
+        table.clear_data()
+        assert table.rowCount() == 0
+        table.set_data([{"Check": "Shear", "Result": "OK"}])
+        assert _table_cells(table) == [["Shear", "OK"]]
+        
+        # Growing and shrinking the row count
+        rows = [{"Check": f"C{i}", "Result": str(i)} for i in range(3)]
+        table.set_data(rows)
+        assert _table_cells(table) == [["C0", "0"], ["C1", "1"], ["C2", "2"]]
+        table.set_data(rows[:1])
+        assert _table_cells(table) == [["C0", "0"]]
+        
+        # Changed headers relabel the columns and refresh the cells
+        table.set_data([{"Name": "Width", "Value": 2.0, "Unit": "m"}])
+        assert [
+            table.horizontalHeaderItem(col).text()
+            for col in range(table.columnCount())
+        ] == ["Name", "Value", "Unit"]
+        assert _table_cells(table) == [["Width", "2.0", "m"]]
+        
+        # Reused and newly created items stay read-only
+        for row in range(table.rowCount()):
+            for col in range(table.columnCount()):
+                flags = table.item(row, col).flags()
+                assert not flags & Qt.ItemFlag.ItemIsEditable
@@ -6,231 +6,219 @@ including setting/getting values, validation, and persistence.
 """
 
 import pytest
-import tempfile
 import json
-from pathlib import Path
 from unittest.mock import Mock, patch
 
+# ConfigManager is backed by QSettings; skip the module when Qt is unavailable
+pytest.importorskip("PyQt6.QtCore")
+
+from src.eng_struct_tools.core_app import config as config_module
 from src.eng_struct_tools.core_app.config import ConfigManager
 
 
+@pytest.fixture(scope="module")
+def config_manager():
+    """Config manager shared by all tests in this module."""
+    # Use a temporary organization/application name for testing
+    return ConfigManager("TestOrg", "TestApp")
+
+
+@pytest.fixture(autouse=True)
+def clear_settings(config_manager):
+    """Clear all settings after each test so tests stay isolated."""
+    yield
+    config_manager.settings.clear()
+
+
 class TestConfigManager:
     """Test cases for ConfigManager class."""
     
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        # Use a temporary organization/application name for testing
-        self.config_manager = ConfigManager("TestOrg", "TestApp")
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        # Clear all settings
-        self.config_manager.settings.clear()
-    
-    def test_initialization(self):
+    def test_initialization(self, config_manager):
         """Test ConfigManager initialization."""
-        assert self.config_manager is not None
-        assert hasattr(self.config_manager, 'settings')
-        assert hasattr(self.config_manager, 'defaults')
-        assert len(self.config_manager.defaults) > 0
+        assert config_manager is not None
+        assert hasattr(config_manager, 'settings')
+        assert hasattr(config_manager, 'defaults')
+        assert len(config_manager.defaults) > 0
     
-    def test_get_setting_with_default(self):
+    def test_get_setting_with_default(self, config_manager):
         """Test getting a setting that uses default value."""
         # Test getting a setting that should use default
-        theme = self.config_manager.get_setting("app/theme")
+        theme = config_manager.get_setting("app/theme")
         assert theme == "default"  # From defaults
         
         # Test getting a setting with explicit default
-        custom_value = self.config_manager.get_setting("nonexistent/key", "custom_default")
+        custom_value = config_manager.get_setting("nonexistent/key", "custom_default")
         assert custom_value == "custom_default"
     
-    def test_set_and_get_setting(self):
+    @pytest.mark.parametrize("key,value", [
+        ("test/string", "test_value"),
+        ("test/integer", 42),
+        ("test/float", 3.14),
+        ("test/boolean", True),
+    ])
+    def test_set_and_get_setting(self, config_manager, key, value):
         """Test setting and getting configuration values."""
-        # Test string value
-        self.config_manager.set_setting("test/string", "test_value")
-        assert self.config_manager.get_setting("test/string") == "test_value"
-        
-        # Test integer value
-        self.config_manager.set_setting("test/integer", 42)
-        assert self.config_manager.get_setting("test/integer") == 42
-        
-        # Test float value
-        self.config_manager.set_setting("test/float", 3.14)
-        assert self.config_manager.get_setting("test/float") == 3.14
-        
-        # Test boolean value
-        self.config_manager.set_setting("test/boolean", True)
-        assert self.config_manager.get_setting("test/boolean") is True
+        config_manager.set_setting(key, value)
+        assert config_manager.get_setting(key) == value
+        assert type(config_manager.get_setting(key)) is type(value)
     
-    def test_complex_data_types(self):
+    def test_complex_data_types(self, config_manager):
         """Test setting and getting complex data types (dict, list)."""
-        # Test dictionary
-        test_dict = {"key1": "value1", "key2": 42, "key3": True}
-        self.config_manager.set_setting("test/dict", test_dict)
-        retrieved_dict = self.config_manager.get_setting("test/dict")
-        assert retrieved_dict == test_dict
-        
-        # Test list
-        test_list = ["item1", "item2", 123, True]
-        self.config_manager.set_setting("test/list", test_list)
-        retrieved_list = self.config_manager.get_setting("test/list")
-        assert retrieved_list == test_list
+        cases = {
+            "test/dict": {"key1": "value1", "key2": 42, "key3": True},
+            "test/list": ["item1", "item2", 123, True],
+        }
+        for key, value in cases.items():
+            config_manager.set_setting(key, value)
+        
+        assert {key: config_manager.get_setting(key) for key in cases} == cases
     
-    def test_has_setting(self):
+    def test_has_setting(self, config_manager):
         """Test checking if a setting exists."""
         # Setting should not exist initially
-        assert not self.config_manager.has_setting("test/exists")
+        assert not config_manager.has_setting("test/exists")
         
         # Set a value
-        self.config_manager.set_setting("test/exists", "value")
+        config_manager.set_setting("test/exists", "value")
         
         # Setting should now exist
-        assert self.config_manager.has_setting("test/exists")
+        assert config_manager.has_setting("test/exists")
     
-    def test_remove_setting(self):
+    def test_remove_setting(self, config_manager):
         """Test removing a setting."""
         # Set a value
-        self.config_manager.set_setting("test/remove", "value")
-        assert self.config_manager.has_setting("test/remove")
+        config_manager.set_setting("test/remove", "value")
+        assert config_manager.has_setting("test/remove")
         
         # Remove the setting
-        self.config_manager.remove_setting("test/remove")
-        assert not self.config_manager.has_setting("test/remove")
+        config_manager.remove_setting("test/remove")
+        assert not config_manager.has_setting("test/remove")
     
-    def test_get_all_settings(self):
+    def test_get_all_settings(self, config_manager):
         """Test getting all settings."""
         # Set some test values
-        self.config_manager.set_setting("test/value1", "data1")
-        self.config_manager.set_setting("test/value2", "data2")
-        self.config_manager.set_setting("other/value", "data3")
+        config_manager.set_setting("test/value1", "data1")
+        config_manager.set_setting("test/value2", "data2")
+        config_manager.set_setting("other/value", "data3")
         
         # Get all settings
-        all_settings = self.config_manager.get_all_settings()
+        all_settings = config_manager.get_all_settings()
         assert isinstance(all_settings, dict)
         assert "test/value1" in all_settings
         assert "test/value2" in all_settings
         assert "other/value" in all_settings
         
         # Get settings with prefix
-        test_settings = self.config_manager.get_all_settings("test")
+        test_settings = config_manager.get_all_settings("test")
         assert len(test_settings) >= 2
     
-    def test_plugin_settings(self):
+    def test_plugin_settings(self, config_manager):
         """Test plugin-specific setting methods."""
         plugin_name = "test_plugin"
         
         # Set plugin setting
-        self.config_manager.set_plugin_setting(plugin_name, "setting1", "value1")
+        config_manager.set_plugin_setting(plugin_name, "setting1", "value1")
         
         # Get plugin setting
-        value = self.config_manager.get_plugin_setting(plugin_name, "setting1")
+        value = config_manager.get_plugin_setting(plugin_name, "setting1")
         assert value == "value1"
         
         # Get plugin setting with default
-        default_value = self.config_manager.get_plugin_setting(plugin_name, "nonexistent", "default")
+        default_value = config_manager.get_plugin_setting(plugin_name, "nonexistent", "default")
         assert default_value == "default"
         
         # Get all plugin settings
-        self.config_manager.set_plugin_setting(plugin_name, "setting2", "value2")
-        plugin_settings = self.config_manager.get_plugin_settings(plugin_name)
+        config_manager.set_plugin_setting(plugin_name, "setting2", "value2")
+        plugin_settings = config_manager.get_plugin_settings(plugin_name)
         assert len(plugin_settings) >= 2
     
-    def test_recent_files(self):
+    def test_recent_files(self, config_manager):
         """Test recent files functionality."""
         # Initially should be empty
-        recent_files = self.config_manager.get_recent_files()
+        recent_files = config_manager.get_recent_files()
         assert isinstance(recent_files, list)
         
         # Add some files
-        self.config_manager.add_recent_file("/path/to/file1.ifc")
-        self.config_manager.add_recent_file("/path/to/file2.ifc")
+        config_manager.add_recent_files(["/path/to/file1.ifc", "/path/to/file2.ifc"])
         
-        recent_files = self.config_manager.get_recent_files()
+        recent_files = config_manager.get_recent_files()
         assert len(recent_files) == 2
         assert recent_files[0] == "/path/to/file2.ifc"  # Most recent first
         assert recent_files[1] == "/path/to/file1.ifc"
         
         # Add duplicate (should move to front)
-        self.config_manager.add_recent_file("/path/to/file1.ifc")
-        recent_files = self.config_manager.get_recent_files()
+        config_manager.add_recent_file("/path/to/file1.ifc")
+        recent_files = config_manager.get_recent_files()
         assert len(recent_files) == 2
         assert recent_files[0] == "/path/to/file1.ifc"
         
         # Clear recent files
-        self.config_manager.clear_recent_files()
-        recent_files = self.config_manager.get_recent_files()
+        config_manager.clear_recent_files()
+        recent_files = config_manager.get_recent_files()
         assert len(recent_files) == 0
     
-    def test_export_import_settings(self):
+    def test_export_import_settings(self, config_manager, tmp_path):
         """Test exporting and importing settings."""
         # Set some test settings
-        self.config_manager.set_setting("test/export1", "value1")
-        self.config_manager.set_setting("test/export2", {"key": "value"})
+        config_manager.set_setting("test/export1", "value1")
+        config_manager.set_setting("test/export2", {"key": "value"})
         
         # Export to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            # Export settings
-            success = self.config_manager.export_settings(temp_path)
-            assert success
-            
-            # Verify file exists and contains data
-            assert Path(temp_path).exists()
-            with open(temp_path, 'r') as f:
-                exported_data = json.load(f)
-            assert "test/export1" in exported_data
-            assert "test/export2" in exported_data
-            
-            # Clear settings and import
-            self.config_manager.remove_setting("test/export1")
-            self.config_manager.remove_setting("test/export2")
-            
-            success = self.config_manager.import_settings(temp_path)
-            assert success
-            
-            # Verify settings were imported
-            assert self.config_manager.get_setting("test/export1") == "value1"
-            assert self.config_manager.get_setting("test/export2") == {"key": "value"}
-            
-        finally:
-            # Clean up temporary file
-            Path(temp_path).unlink(missing_ok=True)
+        temp_path = tmp_path / "settings.json"
+        
+        # Export settings
+        success = config_manager.export_settings(temp_path)
+        assert success
+        
+        # Verify file exists and contains data
+        assert temp_path.exists()
+        exported_data = json.loads(temp_path.read_bytes())
+        assert "test/export1" in exported_data
+        assert "test/export2" in exported_data
+        
+        # Clear settings and import
+        config_manager.settings.clear()
+        
+        success = config_manager.import_settings(temp_path)
+        assert success
+        
+        # Verify settings were imported
+        assert config_manager.get_setting("test/export1") == "value1"
+        assert config_manager.get_setting("test/export2") == {"key": "value"}
     
-    def test_reset_to_defaults(self):
+    def test_reset_to_defaults(self, config_manager):
         """Test resetting settings to defaults."""
         # Set some custom values
-        self.config_manager.set_setting("app/theme", "custom_theme")
-        self.config_manager.set_setting("test/custom", "custom_value")
+        config_manager.set_setting("app/theme", "custom_theme")
+        config_manager.set_setting("test/custom", "custom_value")
         
         # Reset app settings to defaults
-        self.config_manager.reset_to_defaults("app")
+        config_manager.reset_to_defaults("app")
         
         # App theme should be reset to default
-        assert self.config_manager.get_setting("app/theme") == "default"
+        assert config_manager.get_setting("app/theme") == "default"
         
         # Custom setting should still exist
-        assert self.config_manager.get_setting("test/custom") == "custom_value"
+        assert config_manager.get_setting("test/custom") == "custom_value"
         
         # Reset all settings
-        self.config_manager.reset_to_defaults()
+        config_manager.reset_to_defaults()
         
         # All defaults should be restored
-        assert self.config_manager.get_setting("app/theme") == "default"
-        assert self.config_manager.get_setting("units/length") == "mm"
+        assert config_manager.get_setting("app/theme") == "default"
+        assert config_manager.get_setting("units/length") == "mm"
     
-    def test_error_handling(self):
+    def test_error_handling(self, config_manager):
         """Test error handling in configuration operations."""
         # Test export to invalid path
-        success = self.config_manager.export_settings("/invalid/path/file.json")
+        success = config_manager.export_settings("/invalid/path/file.json")
         assert not success
         
         # Test import from non-existent file
-        success = self.config_manager.import_settings("/non/existent/file.json")
+        success = config_manager.import_settings("/non/existent/file.json")
         assert not success
     
-    @patch('src.eng_struct_tools.core_app.config.QSettings')
+    @patch.object(config_module, 'QSettings')
     def test_qsettings_integration(self, mock_qsettings):
         """Test integration with QSettings."""
         # Create a mock QSettings instance
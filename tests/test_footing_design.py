@@ -0,0 +1,91 @@
+"""
+Unit tests for the footing design plugin.
+
+This module contains tests for footing design input validation,
+including the memoization of validation results.
+"""
+
+import pytest
+
+# The plugin module builds its widgets with PyQt6; skip when Qt is unavailable
+pytest.importorskip("PyQt6.QtWidgets")
+
+from src.eng_struct_tools.plugins.footing_design.main import FootingDesignPlugin
+
+
+# Valid inputs shared by the validation tests; tests must copy before changing
+_VALID_INPUT = {
+    "axial_load": 1000.0,
+    "length": 2.0,
+    "width": 2.0,
+    "thickness": 0.5,
+    "concrete_strength": 30.0,
+    "bearing_capacity": 0.2,
+    "cover": 0.05,
+}
+
+
+class TestValidateInput:
+    """Test cases for FootingDesignPlugin.validate_input."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.plugin = FootingDesignPlugin()
+    
+    def test_valid_input(self):
+        """Test that valid input passes validation."""
+        assert self.plugin.validate_input(dict(_VALID_INPUT)) == (True, [])
+    
+    def test_invalid_input(self):
+        """Test that invalid input reports errors."""
+        is_valid, errors = self.plugin.validate_input(
+            dict(_VALID_INPUT, axial_load=-1.0, width=3.0)
+        )
+        
+        assert is_valid is False
+        assert errors == [
+            "Parameter axial_load must be positive",
+            "Length should be greater than or equal to width",
+        ]
+    
+    def test_cache_hit(self):
+        """Test that repeated input is answered from the cache."""
+        self.plugin.validate_input(dict(_VALID_INPUT))
+        assert len(self.plugin._validation_cache) == 1
+        
+        # Replace the cached result to show the second call does not recompute
+        cache_key = next(iter(self.plugin._validation_cache))
+        self.plugin._validation_cache[cache_key] = (False, ["cached"])
+        
+        assert self.plugin.validate_input(dict(_VALID_INPUT)) == (False, ["cached"])
+    
+    def test_cached_errors_are_copied(self):
+        """Test that mutating returned errors does not change the cache."""
+        invalid_input = dict(_VALID_INPUT, axial_load=-1.0)
+        
+        _, errors = self.plugin.validate_input(invalid_input)
+        errors.append("caller note")
+        _, cached_errors = self.plugin.validate_input(invalid_input)
+        cached_errors.clear()
+        
+        assert self.plugin.validate_input(invalid_input) == (
+            False,
+            ["Parameter axial_load must be positive"],
+        )
+    
+    def test_cache_is_cleared_when_full(self):
+        """Test that the cache is cleared once it exceeds 32 entries."""
+        for i in range(33):
+            self.plugin.validate_input(dict(_VALID_INPUT, axial_load=1000.0 + i))
+        assert len(self.plugin._validation_cache) == 33
+        
+        self.plugin.validate_input(dict(_VALID_INPUT, axial_load=2000.0))
+        assert len(self.plugin._validation_cache) == 1
+    
+    def test_unhashable_values_bypass_cache(self):
+        """Test that inputs with unhashable values are validated uncached."""
+        input_data = dict(_VALID_INPUT, notes=["check soil report"])
+        
+        assert self.plugin.validate_input(input_data) == (True, [])
+        assert self.plugin.validate_input(input_data) == (True, [])
+        assert self.plugin._validation_cache == {}
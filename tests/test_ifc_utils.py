@@ -0,0 +1,234 @@
+"""
+Unit tests for the IFCManager class.
+
+This module contains tests for IFC model handling including loading modes,
+element queries and property editing.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("ifcopenshell")
+
+from src.eng_struct_tools.shared_libs import ifc_utils
+from src.eng_struct_tools.shared_libs.ifc_utils import IFCError, IFCManager
+
+
+@pytest.fixture
+def manager():
+    """IFC manager with a new model."""
+    ifc_manager = IFCManager()
+    ifc_manager.create_new_model()
+    return ifc_manager
+
+
+@pytest.fixture
+def ifc_file(manager, tmp_path):
+    """Saved IFC file containing a beam with properties."""
+    manager.create_structural_element("beam", "B1", {"Width": 300.0})
+    file_path = tmp_path / "model.ifc"
+    manager.save_model(file_path)
+    return file_path
+
+
+class TestAvailability:
+    """Test cases for handling ifcopenshell import failures."""
+    
+    def test_broken_install(self, monkeypatch):
+        """Test that an installed but unimportable ifcopenshell is reported."""
+        monkeypatch.setitem(sys.modules, "ifcopenshell.guid", None)
+        monkeypatch.setattr(ifc_utils, "IFC_AVAILABLE", True)
+        monkeypatch.setattr(ifc_utils, "_ifc_manager", None)
+        
+        with pytest.raises(IFCError):
+            IFCManager()
+        
+        assert ifc_utils.get_ifc_manager() is None
+
+
+class TestNewModel:
+    """Test cases for new model creation."""
+    
+    @pytest.mark.parametrize("schema", ["IFC2X3", "IFC4"])
+    def test_new_model_is_schema_valid(self, schema):
+        """Test that the default project structure passes schema validation."""
+        import ifcopenshell.validate
+        
+        ifc_manager = IFCManager()
+        model = ifc_manager.create_new_model(schema)
+        
+        logger = ifcopenshell.validate.json_logger()
+        ifcopenshell.validate.validate(model, logger)
+        assert logger.statements == []
+        assert ifc_manager.validate_model() == (True, [])
+
+
+
+class TestLoadModes:
+    """Test cases for full and streaming load modes."""
+    
+    def test_full_mode(self, ifc_file):
+        """Test that fully loaded models support all queries."""
+        ifc_manager = IFCManager()
+        ifc_manager.load_model(ifc_file)
+        
+        beam = ifc_manager.get_elements_by_type("IfcBeam")[0]
+        assert ifc_manager.get_element_by_guid(beam.GlobalId) == beam
+        assert ifc_manager.get_element_properties(beam) == {
+            "Structural_Properties": {"Width": 300.0}
+        }
+        
+        ifc_manager.update_element_property(beam, "Depth", 600.0)
+        assert ifc_manager.get_element_properties_flat(beam) == {
+            "Structural_Properties.Width": 300.0,
+            "Structural_Properties.Depth": 600.0,
+        }
+    
+    def test_stream_mode_is_read_only(self, ifc_file):
+        """Test that streamed models support type queries only."""
+        ifc_manager = IFCManager()
+        ifc_manager.load_model(ifc_file, mode="stream")
+        
+        beams = ifc_manager.get_elements_by_type("IfcBeam")
+        assert len(beams) == 1
+        
+        with pytest.raises(IFCError):
+            ifc_manager.get_element_by_guid(beams[0].GlobalId)
+        with pytest.raises(IFCError):
+            ifc_manager.get_element_properties(beams[0])
+        with pytest.raises(IFCError):
+            ifc_manager.update_element_property(beams[0], "Depth", 600.0)
+        with pytest.raises(IFCError):
+            ifc_manager.create_structural_element("column", "C1")
+        with pytest.raises(IFCError):
+            ifc_manager.validate_model()
+        
+        info = ifc_manager.get_model_info()
+        assert info["streaming"] is True
+        assert info["project_name"] == "Structural Engineering Project"
+        assert info["units"] == {}
+    
+    def test_unknown_mode(self, ifc_file):
+        """Test that unknown load modes are rejected."""
+        with pytest.raises(IFCError):
+            IFCManager().load_model(ifc_file, mode="auto")
+
+
+class TestCaches:
+    """Test cases for the IFC manager caches."""
+    
+    def test_type_cache_invalidated_by_property_edit(self, manager):
+        """Test that editing an existing property set refreshes by_type results."""
+        beam = manager.create_structural_element("beam", "B1", {"Width": 300.0})
+        assert len(manager.get_elements_by_type("IfcPropertySingleValue")) == 1
+        
+        manager.update_element_property(beam, "Depth", 600.0)
+        
+        assert len(manager.get_elements_by_type("IfcPropertySingleValue")) == len(
+            manager.model.by_type("IfcPropertySingleValue")
+        ) == 2
+    
+    def test_type_cache(self, manager):
+        """Test that by_type results are cached until the model changes."""
+        beams = manager.get_elements_by_type("IfcBeam")
+        assert beams == []
+        assert manager.get_elements_by_type("IfcBeam") is beams
+        
+        manager.create_structural_element("beam", "B1")
+        assert len(manager.get_elements_by_type("IfcBeam")) == 1
+    
+    def test_flush_caches(self, manager):
+        """Test that direct model edits are picked up after flushing caches."""
+        beam = manager.create_structural_element("beam", "B1", {"Width": 300.0})
+        guid = beam.GlobalId
+        assert manager.get_elements_by_type("IfcBeam") == [beam]
+        assert manager.get_element_by_guid(guid) == beam
+        manager.get_element_properties(beam)
+        
+        manager.model.remove(beam)
+        manager.flush_caches()
+        
+        assert manager.get_elements_by_type("IfcBeam") == []
+        assert manager._pset_cache == {}
+        assert manager._guid_cache == {}
+        assert manager.get_element_by_guid(guid) is None
+    
+    def test_unit_cache(self, manager):
+        """Test that project units are looked up once per model."""
+        get_project_unit = ifc_utils.ifcopenshell.util.unit.get_project_unit
+        with patch.object(
+            ifc_utils.ifcopenshell.util.unit,
+            "get_project_unit",
+            wraps=get_project_unit,
+        ) as mock_get_project_unit:
+            assert manager.get_model_info()["units"] == {"length": "METRE"}
+            assert manager.validate_model() == (True, [])
+            mock_get_project_unit.assert_called_once()
+            
+            manager.create_new_model()
+            manager.get_model_info()
+            assert mock_get_project_unit.call_count == 2
+    
+    def test_pset_cache(self, manager):
+        """Test that property sets are cached and refreshed after edits."""
+        beam = manager.create_structural_element("beam", "B1", {"Width": 300.0})
+        get_psets = ifc_utils.ifcopenshell.util.element.get_psets
+        with patch.object(
+            ifc_utils.ifcopenshell.util.element, "get_psets", wraps=get_psets
+        ) as mock_get_psets:
+            manager.get_element_properties(beam)
+            manager.get_element_properties_flat(beam)
+            mock_get_psets.assert_called_once()
+            
+            manager.update_element_property(beam, "Width", 400.0)
+            assert manager.get_element_properties(beam) == {
+                "Structural_Properties": {"Width": 400.0}
+            }
+            
+            manager.flush_pset_cache()
+            manager.get_element_properties(beam)
+            assert mock_get_psets.call_count == 3
+    
+    def test_pset_cache_eviction(self, manager):
+        """Test that the least recently used property sets are evicted."""
+        manager.PSET_CACHE_SIZE = 1
+        beam = manager.create_structural_element("beam", "B1")
+        column = manager.create_structural_element("column", "C1")
+        
+        manager.get_element_properties(beam)
+        manager.get_element_properties(column)
+        
+        assert list(manager._pset_cache) == [column.id()]
+    
+    def test_grouped_and_flat_properties(self, manager):
+        """Test grouped and flattened property views of an element."""
+        beam = manager.create_structural_element("beam", "B1", {"Width": 300.0})
+        manager.update_element_property(beam, "Grade", "C30", pset_name="Concrete")
+        
+        assert manager.get_element_properties(beam) == {
+            "Structural_Properties": {"Width": 300.0},
+            "Concrete": {"Grade": "C30"},
+        }
+        assert manager.get_element_properties_flat(beam) == {
+            "Structural_Properties.Width": 300.0,
+            "Concrete.Grade": "C30",
+        }
+    
+    def test_guid_cache(self, manager):
+        """Test that GUID lookups are cached and dropped for removed elements."""
+        beam = manager.create_structural_element("beam", "B1")
+        guid = beam.GlobalId
+        
+        with patch.object(
+            manager.model, "by_guid", wraps=manager.model.by_guid
+        ) as mock_by_guid:
+            assert manager.get_element_by_guid(guid) == beam
+            assert manager.get_element_by_guid(guid) == beam
+            mock_by_guid.assert_called_once_with(guid)
+        
+        manager.model.remove(beam)
+        
+        assert manager.get_element_by_guid(guid) is None
+        assert guid not in manager._guid_cache
@@ -6,8 +6,8 @@ base classes, interfaces, and plugin information structures.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from typing import List, Dict, Any
+from dataclasses import replace
+from unittest.mock import Mock, call, patch
 
 from src.eng_struct_tools.core_app.plugin_base import (
     PluginBase, StructuralAnalysisPlugin, DesignPlugin,
@@ -15,19 +15,41 @@ from src.eng_struct_tools.core_app.plugin_base import (
 )
 
 
+# Patch target for the dependency imports made by validate_dependencies
+_IMPORT_MODULE_TARGET = (
+    "src.eng_struct_tools.core_app.plugin_base.importlib.import_module"
+)
+
+
+def _noop_callback():
+    """Menu callback that does nothing."""
+
+
+# Sample instances shared by the dataclass tests; tests must not mutate them
+_SAMPLE_PLUGIN_INFO = PluginInfo(
+    name="Test Plugin",
+    version="1.0.0",
+    description="A test plugin",
+    author="Test Author",
+    category="Testing",
+    dependencies=["numpy"]
+)
+
+_SAMPLE_MENU_ITEM = MenuItem(
+    name="Test Item",
+    callback=_noop_callback,
+    tooltip="Test tooltip",
+    shortcut="Ctrl+T",
+    enabled=True
+)
+
+
 class TestPluginInfo:
     """Test cases for PluginInfo dataclass."""
     
     def test_initialization(self):
         """Test PluginInfo initialization."""
-        info = PluginInfo(
-            name="Test Plugin",
-            version="1.0.0",
-            description="A test plugin",
-            author="Test Author",
-            category="Testing",
-            dependencies=["numpy"]
-        )
+        info = _SAMPLE_PLUGIN_INFO
         
         assert info.name == "Test Plugin"
         assert info.version == "1.0.0"
@@ -40,14 +62,7 @@ class TestPluginInfo:
     
     def test_default_values(self):
         """Test PluginInfo default values."""
-        info = PluginInfo(
-            name="Test",
-            version="1.0",
-            description="Test",
-            author="Author",
-            category="Category",
-            dependencies=[]
-        )
+        info = replace(_SAMPLE_PLUGIN_INFO, dependencies=[])
         
         assert info.status == PluginStatus.UNLOADED
         assert info.error_message is None
@@ -58,25 +73,17 @@ class TestMenuItem:
     
     def test_initialization(self):
         """Test MenuItem initialization."""
-        callback = lambda: None
-        item = MenuItem(
-            name="Test Item",
-            callback=callback,
-            tooltip="Test tooltip",
-            shortcut="Ctrl+T",
-            enabled=True
-        )
+        item = _SAMPLE_MENU_ITEM
         
         assert item.name == "Test Item"
-        assert item.callback == callback
+        assert item.callback == _noop_callback
         assert item.tooltip == "Test tooltip"
         assert item.shortcut == "Ctrl+T"
         assert item.enabled is True
     
     def test_default_values(self):
         """Test MenuItem default values."""
-        callback = lambda: None
-        item = MenuItem(name="Test", callback=callback)
+        item = MenuItem(name="Test", callback=_noop_callback)
         
         assert item.icon is None
         assert item.tooltip is None
@@ -84,20 +91,28 @@ class TestMenuItem:
         assert item.enabled is True
 
 
+@pytest.fixture(scope="class")
+def host_api_parts():
+    """HostAPI and its mocked collaborators, shared across a test class."""
+    mock_main_window = Mock()
+    mock_config_manager = Mock()
+    mock_logger = Mock()
+    
+    host_api = HostAPI(mock_main_window, mock_config_manager, mock_logger)
+    return host_api, mock_main_window, mock_config_manager, mock_logger
+
+
 class TestHostAPI:
     """Test cases for HostAPI class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_main_window = Mock()
-        self.mock_config_manager = Mock()
-        self.mock_logger = Mock()
+    @pytest.fixture(autouse=True)
+    def setup_host_api(self, host_api_parts):
+        """Bind the shared HostAPI and reset its mocks before each test."""
+        for mock in host_api_parts[1:]:
+            mock.reset_mock(return_value=True, side_effect=True)
         
-        self.host_api = HostAPI(
-            self.mock_main_window,
-            self.mock_config_manager,
-            self.mock_logger
-        )
+        (self.host_api, self.mock_main_window,
+         self.mock_config_manager, self.mock_logger) = host_api_parts
     
     def test_initialization(self):
         """Test HostAPI initialization."""
@@ -133,41 +148,65 @@ class TestHostAPI:
         self.host_api.set_setting("test_key", "test_value")
         self.mock_config_manager.set_setting.assert_called_once_with("test_key", "test_value")
     
-    def test_logging_methods(self):
+    @pytest.mark.parametrize("method,level", [
+        ("log_info", "info"),
+        ("log_warning", "warning"),
+        ("log_error", "error"),
+    ])
+    def test_logging_methods(self, method, level):
         """Test logging methods."""
-        self.host_api.log_info("Info message")
-        self.mock_logger.info.assert_called_once_with("Info message")
-        
-        self.host_api.log_warning("Warning message")
-        self.mock_logger.warning.assert_called_once_with("Warning message")
-        
-        self.host_api.log_error("Error message")
-        self.mock_logger.error.assert_called_once_with("Error message")
+        getattr(self.host_api, method)("Test message")
+        assert self.mock_logger.method_calls == [getattr(call, level)("Test message")]
 
 
-class ConcretePlugin(PluginBase):
-    """Concrete implementation of PluginBase for testing."""
-    
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="Test Plugin",
+def _make_plugin_class(base, name, category, **methods):
+    """Build a concrete subclass of a plugin base class for testing."""
+    def __init__(self):
+        base.__init__(self)
+        self._info = PluginInfo(
+            name=f"{name} Plugin",
             version="1.0.0",
-            description="Test plugin",
+            description=f"{name} plugin",
             author="Test Author",
-            category="Testing",
+            category=category,
             dependencies=[]
         )
     
-    def initialize(self, host_api: HostAPI) -> bool:
-        self.host_api = host_api
-        self._is_initialized = True
-        return True
-    
-    def get_menu_items(self) -> List[MenuItem]:
-        return [MenuItem(name="Test Action", callback=lambda: None)]
-    
-    def create_main_widget(self, parent=None):
-        return Mock()
+    namespace = {
+        "__doc__": f"Concrete implementation of {base.__name__} for testing.",
+        "__init__": __init__,
+        "get_plugin_info": lambda self: self._info,
+        "initialize": lambda self, host_api: True,
+        "get_menu_items": lambda self: [],
+        "create_main_widget": lambda self, parent=None: Mock(),
+    }
+    namespace.update(methods)
+    return type(f"Concrete{base.__name__}", (base,), namespace)
+
+
+def _initialize_with_host(self, host_api: HostAPI) -> bool:
+    self.host_api = host_api
+    self._is_initialized = True
+    return True
+
+
+ConcretePlugin = _make_plugin_class(
+    PluginBase, "Test", "Testing",
+    initialize=_initialize_with_host,
+    get_menu_items=lambda self: [MenuItem(name="Test Action", callback=lambda: None)],
+)
+
+ConcreteAnalysisPlugin = _make_plugin_class(
+    StructuralAnalysisPlugin, "Analysis", "Analysis",
+    run_analysis=lambda self, input_data: {"result": "test_result"},
+    validate_input=lambda self, input_data: (True, []),
+)
+
+ConcreteDesignPlugin = _make_plugin_class(
+    DesignPlugin, "Design", "Design",
+    run_design=lambda self, input_data: {"design_result": "test_design"},
+    check_design_codes=lambda self: ["ACI 318", "Eurocode 2"],
+)
 
 
 class TestPluginBase:
@@ -176,7 +215,7 @@ class TestPluginBase:
     def setup_method(self):
         """Set up test fixtures."""
         self.plugin = ConcretePlugin()
-        self.mock_host_api = Mock(spec=HostAPI)
+        self.mock_host_api = Mock()
     
     def test_initialization(self):
         """Test plugin initialization."""
@@ -210,15 +249,29 @@ class TestPluginBase:
         assert is_valid is True
         assert missing == []
         
-        # Test with missing dependency
-        plugin_info = self.plugin.get_plugin_info()
-        plugin_info.dependencies = ["nonexistent_module"]
-        self.plugin.plugin_info = plugin_info
+        # Test with missing dependency (on a copy, leaving the cached info intact)
+        cached_info = self.plugin.get_plugin_info()
+        self.plugin._info = replace(cached_info, dependencies=["nonexistent_module"])
+        assert cached_info.dependencies == []
         
         is_valid, missing = self.plugin.validate_dependencies()
         assert is_valid is False
         assert "nonexistent_module" in missing
     
+    def test_validate_dependencies_available(self):
+        """Test dependency validation when every dependency imports."""
+        self.plugin._info = replace(
+            self.plugin.get_plugin_info(), dependencies=["numpy"]
+        )
+        
+        with patch(_IMPORT_MODULE_TARGET) as mock_import:
+            mock_import.return_value = object()
+            is_valid, missing = self.plugin.validate_dependencies()
+        
+        assert is_valid is True
+        assert missing == []
+        mock_import.assert_called_once_with("numpy")
+    
     def test_lifecycle_methods(self):
         """Test plugin lifecycle methods."""
         # These should not raise exceptions
@@ -232,35 +285,6 @@ class TestPluginBase:
         assert schema is None
 
 
-class ConcreteAnalysisPlugin(StructuralAnalysisPlugin):
-    """Concrete implementation of StructuralAnalysisPlugin for testing."""
-    
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="Analysis Plugin",
-            version="1.0.0",
-            description="Analysis plugin",
-            author="Test Author",
-            category="Analysis",
-            dependencies=[]
-        )
-    
-    def initialize(self, host_api: HostAPI) -> bool:
-        return True
-    
-    def get_menu_items(self) -> List[MenuItem]:
-        return []
-    
-    def create_main_widget(self, parent=None):
-        return Mock()
-    
-    def run_analysis(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        return {"result": "test_result"}
-    
-    def validate_input(self, input_data: Dict[str, Any]) -> tuple[bool, List[str]]:
-        return True, []
-
-
 class TestStructuralAnalysisPlugin:
     """Test cases for StructuralAnalysisPlugin class."""
     
@@ -296,35 +320,6 @@ class TestStructuralAnalysisPlugin:
         assert self.plugin.analysis_results is None
 
 
-class ConcreteDesignPlugin(DesignPlugin):
-    """Concrete implementation of DesignPlugin for testing."""
-    
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="Design Plugin",
-            version="1.0.0",
-            description="Design plugin",
-            author="Test Author",
-            category="Design",
-            dependencies=[]
-        )
-    
-    def initialize(self, host_api: HostAPI) -> bool:
-        return True
-    
-    def get_menu_items(self) -> List[MenuItem]:
-        return []
-    
-    def create_main_widget(self, parent=None):
-        return Mock()
-    
-    def run_design(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        return {"design_result": "test_design"}
-    
-    def check_design_codes(self) -> List[str]:
-        return ["ACI 318", "Eurocode 2"]
-
-
 class TestDesignPlugin:
     """Test cases for DesignPlugin class."""
     
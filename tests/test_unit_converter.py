@@ -5,10 +5,23 @@ This module contains tests for unit conversion functionality
 including conversions between different unit systems and validation.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import patch, Mock
 
-from src.eng_struct_tools.shared_libs.unit_converter import UnitConverter, UnitSystem
+from src.eng_struct_tools.shared_libs.unit_converter import (
+    QuantityType,
+    UnitConverter,
+    UnitSystem,
+    _factor,
+    _parse,
+)
+
+# Quantity types every predefined unit system must define
+REQUIRED_QUANTITIES = [
+    "length", "area", "volume", "force", "moment", "stress",
+    "pressure", "density", "mass", "time", "temperature"
+]
 
 
 class TestUnitSystem:
@@ -31,6 +44,14 @@ class TestUnitSystem:
         assert system.get_unit("force") == "N"
         assert system.get_unit("nonexistent") == "dimensionless"
     
+    def test_get_unit_by_type(self):
+        """Test getting units by QuantityType."""
+        units = {"length": "m", "force": "N"}
+        system = UnitSystem("Test System", units)
+        assert system.get_unit_by_type(QuantityType.LENGTH) == "m"
+        assert system.get_unit_by_type(QuantityType.FORCE) == "N"
+        assert system.get_unit_by_type(QuantityType.STRESS) == "dimensionless"
+    
     def test_string_representation(self):
         """Test string representation of UnitSystem."""
         system = UnitSystem("Test System", {})
@@ -42,6 +63,8 @@ class TestUnitConverter:
     
     def setup_method(self):
         """Set up test fixtures before each test method."""
+        _factor.cache_clear()
+        _parse.cache_clear()
         self.converter = UnitConverter()
     
     def test_initialization(self):
@@ -95,13 +118,15 @@ class TestUnitConverter:
         assert "SI" in systems
         assert "Imperial" in systems
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_convert(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_convert(self, mock_get_ureg):
         """Test unit conversion."""
+        mock_ureg = mock_get_ureg.return_value
         # Mock the pint registry
         mock_quantity = Mock()
         mock_quantity.to.return_value.magnitude = 1000.0
         mock_ureg.Quantity.return_value = mock_quantity
+        mock_ureg.get_dimensionality.return_value = {"[length]": 1}
         
         # Test conversion
         result = self.converter.convert(1.0, "m", "mm")
@@ -110,10 +135,50 @@ class TestUnitConverter:
         mock_ureg.Quantity.assert_called_once_with(1.0, "m")
         mock_quantity.to.assert_called_once_with("mm")
         assert result == 1000.0
+        
+        # Repeated conversions reuse the cached factor
+        assert self.converter.convert(2.5, "m", "mm") == 2500.0
+        mock_ureg.Quantity.assert_called_once()
+        
+        # Other converter instances share the same factor cache
+        assert UnitConverter().convert(3.0, "m", "mm") == 3000.0
+        info = _factor.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+    
+    def test_convert_offset_units(self):
+        """Test conversion between temperature units with an offset."""
+        assert self.converter.convert(100.0, "degC", "degF") == pytest.approx(212.0)
+        assert self.converter.convert(0.0, "degC", "K") == pytest.approx(273.15)
+    
+    def test_convert_array(self):
+        """Test converting an array of values."""
+        values = np.arange(1000.0)
+        
+        result = self.converter.convert_array(values, "m", "mm")
+        np.testing.assert_allclose(result, values * 1000.0)
+        
+        # Offset units
+        result = self.converter.convert_array([0.0, 100.0], "degC", "degF")
+        np.testing.assert_allclose(result, [32.0, 212.0])
+        
+        with pytest.raises(ValueError):
+            self.converter.convert_array(values, "m", "kg")
+    
+    def test_convert_to_system_array(self):
+        """Test converting an array of values to a unit system."""
+        result = self.converter.convert_to_system_array(
+            [1.0, 2.0],
+            "m",
+            "length",
+            "SI_Engineering",
+        )
+        np.testing.assert_allclose(result, [1000.0, 2000.0])
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_convert_error_handling(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_convert_error_handling(self, mock_get_ureg):
         """Test error handling in unit conversion."""
+        mock_ureg = mock_get_ureg.return_value
         # Mock pint to raise an exception
         mock_ureg.Quantity.side_effect = Exception("Invalid unit")
         
@@ -149,9 +214,10 @@ class TestUnitConverter:
         with pytest.raises(ValueError):
             self.converter.get_unit_for_quantity("length", "InvalidSystem")
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_validate_unit(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_validate_unit(self, mock_get_ureg):
         """Test unit validation."""
+        mock_ureg = mock_get_ureg.return_value
         # Mock successful parsing
         mock_ureg.parse_expression.return_value = Mock()
         assert self.converter.validate_unit("m") is True
@@ -159,10 +225,17 @@ class TestUnitConverter:
         # Mock failed parsing
         mock_ureg.parse_expression.side_effect = Exception("Invalid")
         assert self.converter.validate_unit("invalid_unit") is False
+        
+        # Known-invalid units are rejected without parsing again
+        mock_ureg.parse_expression.reset_mock()
+        assert self.converter.validate_unit("invalid_unit") is False
+        assert self.converter.are_units_compatible("invalid_unit", "m") is False
+        mock_ureg.parse_expression.assert_not_called()
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_get_unit_dimensions(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_get_unit_dimensions(self, mock_get_ureg):
         """Test getting unit dimensions."""
+        mock_ureg = mock_get_ureg.return_value
         # Mock successful parsing
         mock_quantity = Mock()
         mock_quantity.dimensionality = "[length]"
@@ -171,14 +244,20 @@ class TestUnitConverter:
         dimensions = self.converter.get_unit_dimensions("m")
         assert dimensions == "[length]"
         
+        # Repeated lookups reuse the parsed expression
+        assert self.converter.get_unit_dimensions("m") == "[length]"
+        mock_ureg.parse_expression.assert_called_once_with("m")
+        assert _parse.cache_info().hits == 1
+        
         # Mock failed parsing
         mock_ureg.parse_expression.side_effect = Exception("Invalid")
         dimensions = self.converter.get_unit_dimensions("invalid")
         assert dimensions == "unknown"
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_are_units_compatible(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_are_units_compatible(self, mock_get_ureg):
         """Test checking unit compatibility."""
+        mock_ureg = mock_get_ureg.return_value
         # Mock compatible units
         mock_q1 = Mock()
         mock_q1.dimensionality = "[length]"
@@ -188,9 +267,10 @@ class TestUnitConverter:
         
         assert self.converter.are_units_compatible("m", "mm") is True
         
-        # Mock incompatible units
-        mock_q2.dimensionality = "[mass]"
-        mock_ureg.parse_expression.side_effect = [mock_q1, mock_q2]
+        # Mock incompatible units ("m" is already parsed and cached)
+        mock_q3 = Mock()
+        mock_q3.dimensionality = "[mass]"
+        mock_ureg.parse_expression.side_effect = [mock_q3]
         
         assert self.converter.are_units_compatible("m", "kg") is False
         
@@ -198,21 +278,25 @@ class TestUnitConverter:
         mock_ureg.parse_expression.side_effect = Exception("Invalid")
         assert self.converter.are_units_compatible("invalid1", "invalid2") is False
     
-    @patch('src.eng_struct_tools.shared_libs.unit_converter.ureg')
-    def test_format_value_with_unit(self, mock_ureg):
+    @patch('src.eng_struct_tools.shared_libs.unit_converter._get_ureg')
+    def test_format_value_with_unit(self, mock_get_ureg):
         """Test formatting value with unit."""
-        # Mock quantity
-        mock_quantity = Mock()
-        mock_quantity.units = Mock()
-        mock_quantity.units.__format__ = Mock(return_value="mm")
-        mock_ureg.Quantity.return_value = mock_quantity
+        mock_ureg = mock_get_ureg.return_value
+        # Mock unit
+        mock_unit = Mock()
+        mock_unit.__format__ = Mock(return_value="mm")
+        mock_ureg.Unit.return_value = mock_unit
         
         formatted = self.converter.format_value_with_unit(1000.0, "mm", 2)
         assert "1000.00" in formatted
         assert "mm" in formatted
         
+        # The rendered unit is reused for later values
+        assert self.converter.format_value_with_unit(2.5, "mm", 1) == "2.5 mm"
+        mock_ureg.Unit.assert_called_once_with("mm")
+        
         # Mock error case
-        mock_ureg.Quantity.side_effect = Exception("Invalid")
+        mock_ureg.Unit.side_effect = Exception("Invalid")
         formatted = self.converter.format_value_with_unit(1000.0, "invalid", 2)
         assert formatted == "1000.00 invalid"
     
@@ -235,24 +319,28 @@ class TestUnitConverter:
         unknown_units = self.converter.get_common_units_for_quantity("unknown")
         assert unknown_units == []
     
-    def test_unit_system_completeness(self):
+    @pytest.mark.parametrize(
+        "system_name,quantity",
+        [
+            (system_name, quantity)
+            for system_name in UnitConverter.UNIT_SYSTEMS
+            for quantity in REQUIRED_QUANTITIES
+        ],
+    )
+    def test_unit_system_completeness(self, system_name, quantity):
         """Test that all unit systems have required quantity types."""
-        required_quantities = [
-            "length", "area", "volume", "force", "moment", "stress",
-            "pressure", "density", "mass", "time", "temperature"
-        ]
-        
-        for system_name, system in self.converter.UNIT_SYSTEMS.items():
-            for quantity in required_quantities:
-                unit = system.get_unit(quantity)
-                assert unit != "dimensionless", f"System {system_name} missing {quantity}"
+        system = self.converter.UNIT_SYSTEMS[system_name]
+        unit = system.get_unit(quantity)
+        assert unit != "dimensionless", f"System {system_name} missing {quantity}"
     
     def test_setup_aliases(self):
         """Test that unit aliases are set up correctly."""
-        # This is tested indirectly through the initialization
-        # The _setup_aliases method should not raise exceptions
         converter = UnitConverter()
         assert converter is not None
+        
+        # Aliases are defined with the shared registry
+        assert converter.convert(1.0, "ksf", "psf") == pytest.approx(1000.0)
+        assert converter.validate_unit("pcf") is True
     
     def test_global_instance(self):
         """Test that global unit converter instance is available."""